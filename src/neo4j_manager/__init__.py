@@ -1,7 +1,20 @@
 """Neo4j Manager - Utilities for managing Neo4j database operations."""
 
-from .connection import Neo4jConnection
-from .backup import BackupManager
-from .health_check import HealthChecker
-
 __all__ = ["Neo4jConnection", "BackupManager", "HealthChecker"]
+
+# PEP 562 lazy loading: importing the package stays cheap, and the heavy
+# neo4j driver tree is only pulled in when a symbol is actually used.
+_SUBMODULES = {
+    "Neo4jConnection": "connection",
+    "BackupManager": "backup",
+    "HealthChecker": "health_check",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        import importlib
+
+        module = importlib.import_module(f".{_SUBMODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
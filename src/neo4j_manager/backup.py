@@ -2,47 +2,156 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+import operator
 import os
-from datetime import datetime
-from typing import Optional, Dict
+import subprocess
+import time
+from typing import Any, Final, Optional, Dict, List, Tuple
 from pathlib import Path
 from .connection import Neo4jConnection
 
 logger = logging.getLogger(__name__)
 
+# APOC Cypher hoisted to constants: built once at import, and the stable
+# string objects keep the driver- and server-side query caches warm
+_Q_EXPORT_GRAPHML: Final = """
+CALL apoc.export.graphml.all($file, $config)
+YIELD file, nodes, relationships, time
+RETURN file, nodes, relationships, time
+"""
+_Q_IMPORT_GRAPHML: Final = """
+CALL apoc.import.graphml($file, $config)
+YIELD nodes, relationships, time
+RETURN nodes, relationships, time
+"""
+_Q_EXPORT_CSV: Final = """
+CALL apoc.export.csv.all($file, $config)
+YIELD file, nodes, relationships, time
+RETURN file, nodes, relationships, time
+"""
+# The streamed import phases below mirror apoc.import.graphml output: real
+# labels come from the node's `labels` attribute, property values are cast
+# back through the GraphML <key> declarations, and the :_Import scaffolding
+# (label, id property, index) is stripped once relationships are wired up.
+_Q_IMPORT_KEYS_STREAMED: Final = """
+CALL apoc.load.xml($file, '/graphml/key', $config, true)
+YIELD value
+RETURN value.`attr.name` as name, value.`attr.type` as type
+"""
+_Q_IMPORT_CREATE_INDEX: Final = (
+    "CREATE INDEX _import_id_idx IF NOT EXISTS FOR (n:_Import) ON (n._import_id)"
+)
+_Q_IMPORT_DROP_INDEX: Final = "DROP INDEX _import_id_idx IF EXISTS"
+# Casts one GraphML text value through the declared key type (shared by the
+# node and relationship phases via string reuse). The `labels`/`label`
+# bookkeeping elements APOC writes for node labels and relationship types
+# are handled structurally above, not stored as properties.
+_CAST_DATA = (
+    "[d IN value._children WHERE d._type = 'data' AND NOT d.key IN ['labels', 'label'] | "
+    "[d.key, CASE $types[d.key] "
+    "WHEN 'long' THEN toInteger(d._text) "
+    "WHEN 'int' THEN toInteger(d._text) "
+    "WHEN 'double' THEN toFloat(d._text) "
+    "WHEN 'float' THEN toFloat(d._text) "
+    "WHEN 'boolean' THEN d._text = 'true' "
+    "ELSE d._text END]]"
+)
+_Q_IMPORT_NODES_STREAMED: Final = f"""
+CALL apoc.periodic.iterate(
+    "CALL apoc.load.xml($file, '/graphml/graph/node', $loadConfig, true)
+     YIELD value RETURN value",
+    "CREATE (n:_Import {{_import_id: value.id}})
+     WITH n, value
+     CALL apoc.create.addLabels(n,
+         [l IN split(coalesce(value.labels, ''), ':') WHERE l <> '']) YIELD node
+     SET node += apoc.map.fromPairs({_CAST_DATA})",
+    {{batchSize: $batchSize, parallel: true, concurrency: $concurrency,
+     retries: 3, params: {{file: $file, types: $types, loadConfig: $loadConfig}}}}
+)
+YIELD total, failedBatches
+RETURN total, failedBatches
+"""
+_Q_IMPORT_RELS_STREAMED: Final = f"""
+CALL apoc.periodic.iterate(
+    "CALL apoc.load.xml($file, '/graphml/graph/edge', $loadConfig, true)
+     YIELD value RETURN value",
+    "MATCH (a:_Import {{_import_id: value.source}})
+     MATCH (b:_Import {{_import_id: value.target}})
+     CALL apoc.create.relationship(
+         a, coalesce(value.label, 'RELATED'),
+         apoc.map.fromPairs({_CAST_DATA}), b) YIELD rel
+     RETURN rel",
+    {{batchSize: $batchSize, parallel: false, retries: 3,
+     params: {{file: $file, types: $types, loadConfig: $loadConfig}}}}
+)
+YIELD total, failedBatches
+RETURN total, failedBatches
+"""
+_Q_IMPORT_STRIP_SCAFFOLDING: Final = """
+CALL apoc.periodic.iterate(
+    'MATCH (n:_Import) RETURN n',
+    'REMOVE n:_Import REMOVE n._import_id',
+    {batchSize: $batchSize, parallel: false}
+)
+YIELD total, failedBatches
+RETURN total, failedBatches
+"""
+
 
 class BackupManager:
     """Manages Neo4j backup and restore operations."""
 
-    def __init__(self, connection: Neo4jConnection, backup_dir: str = "./backup"):
+    def __init__(
+        self,
+        connection: Neo4jConnection,
+        backup_dir: str = "./backup",
+        create_dir: bool = True,
+    ):
         """
         Initialize backup manager.
 
         Args:
             connection: Neo4j connection instance
             backup_dir: Directory to store backups
+            create_dir: Create the backup directory if missing. Pass False
+                when only server-side operations are used and no local
+                directory is needed.
         """
         self.connection = connection
         self.backup_dir = Path(backup_dir)
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        if create_dir:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+        # Backup listing cached against the directory's own mtime, which
+        # changes iff files are added, removed, or renamed
+        self._listing_cache: Optional[Tuple[int, List[Path]]] = None
+        # Monotonic suffix so filenames generated within one second stay unique
+        self._seq = itertools.count()
 
     def create_backup_filename(self, prefix: str = "neo4j_backup") -> str:
         """
         Generate timestamped backup filename.
 
+        Appends a monotonic sequence number so filenames generated in the
+        same second never collide.
+
         Args:
             prefix: Filename prefix
 
         Returns:
             Backup filename
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{prefix}_{timestamp}.graphml"
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+        return f"{prefix}_{timestamp}_{next(self._seq):04d}.graphml.gz"
 
     def export_to_graphml(self, filename: Optional[str] = None, include_types: bool = True) -> str:
         """
-        Export database to GraphML format using APOC.
+        Export database to gzip-compressed GraphML format using APOC.
+
+        GraphML is verbose XML, so exports are gzip-streamed by APOC itself
+        (compression: GZIP), cutting bytes written by roughly an order of
+        magnitude.
 
         Args:
             filename: Output filename (auto-generated if None)
@@ -57,39 +166,56 @@ class BackupManager:
         if filename is None:
             filename = self.create_backup_filename()
 
-        # Remove .graphml extension if present (APOC adds it)
-        filename_base = filename.replace(".graphml", "")
+        # Normalize any .graphml / .graphml.gz suffix back to the base name
+        filename_base = filename.replace(".graphml.gz", "").replace(".graphml", "")
+        output_name = f"{filename_base}.graphml.gz"
 
-        query = f"""
-        CALL apoc.export.graphml.all('{filename_base}.graphml', {{
-            useTypes: {str(include_types).lower()},
-            readLabels: true,
-            storeNodeIds: false
-        }})
-        YIELD file, nodes, relationships, time
-        RETURN file, nodes, relationships, time
-        """
+        # Parameterized so every export shares one cached query plan
+        parameters = {
+            "file": output_name,
+            "config": {
+                "useTypes": include_types,
+                "readLabels": True,
+                "storeNodeIds": False,
+                "compression": "GZIP",
+            },
+        }
 
         try:
-            result = self.connection.execute_query(query)
+            result = self.connection.execute_query(_Q_EXPORT_GRAPHML, parameters)
             if result:
                 logger.info(
                     f"Exported {result[0]['nodes']} nodes and "
                     f"{result[0]['relationships']} relationships in "
                     f"{result[0]['time']}ms"
                 )
-            return str(self.backup_dir / f"{filename_base}.graphml")
+            return str(self.backup_dir / output_name)
         except Exception as e:
             logger.error(f"Export failed: {e}")
             raise
 
-    def import_from_graphml(self, filepath: str, clear_database: bool = False) -> Dict[str, int]:
+    def import_from_graphml(
+        self,
+        filepath: str | Path,
+        clear_database: bool = False,
+        parallel: bool = False,
+        batch_size: int = 10_000,
+        concurrency: int = 16,
+    ) -> Dict[str, int]:
         """
         Import database from GraphML format using APOC.
 
+        By default uses the single-threaded `apoc.import.graphml` procedure.
+        For large files (which can exhaust memory in the monolithic importer),
+        set `parallel=True` to stream node and relationship elements through
+        `apoc.periodic.iterate` in batches with concurrent workers instead.
+
         Args:
             filepath: Path to GraphML file
             clear_database: Whether to clear database before import
+            parallel: Stream the import via apoc.periodic.iterate
+            batch_size: Rows per transaction batch
+            concurrency: Worker count for the parallel path
 
         Returns:
             Dictionary with import statistics
@@ -98,31 +224,46 @@ class BackupManager:
             FileNotFoundError: If file doesn't exist
             Exception: If import fails
         """
-        if not os.path.exists(filepath):
+        # One stat() both validates existence and yields the size
+        path = Path(filepath)
+        try:
+            file_stat = path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Backup file not found: {filepath}")
 
+        # Bound transaction heap usage on huge files with smaller batches
+        if file_stat.st_size >= 100 << 20:
+            batch_size = min(batch_size, 1000)
+
         # Clear database if requested
         if clear_database:
             logger.warning("Clearing database before import")
             self.connection.clear_database()
 
         # Get filename for APOC (needs to be in import directory)
-        filename = os.path.basename(filepath)
+        filename = path.name
 
-        query = f"""
-        CALL apoc.import.graphml('file:///{filename}', {{
-            readLabels: true,
-            storeNodeIds: false,
-            defaultRelationshipType: 'RELATED',
-            batchSize: 1000,
-            useTypes: false
-        }})
-        YIELD nodes, relationships, time
-        RETURN nodes, relationships, time
-        """
+        if parallel:
+            return self._import_graphml_streamed(
+                f"file:///{filename}",
+                batch_size=batch_size,
+                concurrency=concurrency,
+                compressed=filename.endswith(".gz"),
+            )
+
+        config: Dict[str, Any] = {
+            "readLabels": True,
+            "storeNodeIds": False,
+            "defaultRelationshipType": "RELATED",
+            "batchSize": batch_size,
+            "useTypes": False,
+        }
+        if filename.endswith(".gz"):
+            config["compression"] = "GZIP"
+        parameters = {"file": f"file:///{filename}", "config": config}
 
         try:
-            result = self.connection.execute_query(query)
+            result = self.connection.execute_query(_Q_IMPORT_GRAPHML, parameters)
             if result:
                 stats = {
                     "nodes": result[0]["nodes"],
@@ -140,14 +281,185 @@ class BackupManager:
             logger.error(f"Import failed: {e}")
             raise
 
+    def export_to_csv(self, filename: Optional[str] = None) -> str:
+        """
+        Export database to CSV format using APOC.
+
+        Produces files compatible with `neo4j-admin database import`, making
+        this the natural companion to import_from_csv_admin for cold reloads.
+
+        Args:
+            filename: Output filename (auto-generated if None)
+
+        Returns:
+            Path to exported file
+
+        Raises:
+            Exception: If APOC is not available or export fails
+        """
+        if filename is None:
+            # The export config sets no compression, so drop the .gz suffix
+            # the GraphML naming scheme carries
+            filename = self.create_backup_filename().replace(".graphml.gz", ".csv")
+
+        parameters = {"file": filename, "config": {"bulkImport": True}}
+
+        try:
+            result = self.connection.execute_query(_Q_EXPORT_CSV, parameters)
+            if result:
+                logger.info(
+                    f"Exported {result[0]['nodes']} nodes and "
+                    f"{result[0]['relationships']} relationships to CSV in "
+                    f"{result[0]['time']}ms"
+                )
+            return str(self.backup_dir / filename)
+        except Exception as e:
+            logger.error(f"CSV export failed: {e}")
+            raise
+
+    def import_from_csv_admin(
+        self, nodes_file: str, relationships_file: str, database: str = "neo4j"
+    ) -> None:
+        """
+        Bulk-load a database offline with `neo4j-admin database import full`.
+
+        This bypasses the transaction layer entirely, which makes it far
+        faster than Cypher/APOC imports for restoring into an empty database.
+        Tradeoff: the target database must be stopped, and existing contents
+        are overwritten. Accepts CSV files; Parquet files (Neo4j 5.26+) work
+        with the same flags.
+
+        Args:
+            nodes_file: Path to nodes CSV (or Parquet) file
+            relationships_file: Path to relationships CSV (or Parquet) file
+            database: Target database name
+
+        Raises:
+            FileNotFoundError: If either input file doesn't exist
+            subprocess.CalledProcessError: If neo4j-admin fails
+        """
+        for input_file in (nodes_file, relationships_file):
+            if not Path(input_file).is_file():
+                raise FileNotFoundError(f"Import file not found: {input_file}")
+
+        command = [
+            "neo4j-admin",
+            "database",
+            "import",
+            "full",
+            "--nodes",
+            str(nodes_file),
+            "--relationships",
+            str(relationships_file),
+            "--overwrite-destination",
+            database,
+        ]
+        logger.warning(f"Running offline bulk import into '{database}' (overwrites contents)")
+        subprocess.run(command, check=True)
+        logger.info(f"Offline bulk import into '{database}' completed")
+
+    def _import_graphml_streamed(
+        self, file_url: str, batch_size: int, concurrency: int, compressed: bool = False
+    ) -> Dict[str, int]:
+        """
+        Stream a GraphML import in batches via apoc.periodic.iterate.
+
+        Produces the same graph as apoc.import.graphml: real labels are
+        applied from the GraphML labels attribute, property values are cast
+        through the file's <key> type declarations, and relationships carry
+        their exported properties. Nodes are created in parallel batches
+        under a temporary :_Import(_import_id) index so the relationship
+        phase does id lookups instead of label scans; the scaffolding label,
+        property, and index are removed before returning.
+
+        Args:
+            file_url: file:/// URL of the GraphML file (import directory)
+            batch_size: Rows per transaction batch
+            concurrency: Parallel workers for the node phase
+            compressed: Whether the file is gzipped (the default export
+                format), so apoc.load.xml decompresses the stream
+
+        Returns:
+            Dictionary with import statistics
+        """
+        started = time.monotonic()
+
+        # apoc.load.xml doesn't sniff compression from the filename the way
+        # apoc.import.graphml does, so it has to be told explicitly
+        load_config: Dict[str, Any] = {"compression": "GZIP"} if compressed else {}
+
+        # Key declarations map property names to their exported types, so
+        # values can be cast back instead of landing as raw strings
+        key_rows = self.connection.execute_query(
+            _Q_IMPORT_KEYS_STREAMED, {"file": file_url, "config": load_config}
+        )
+        types = {row["name"]: row["type"] for row in key_rows if row.get("name")}
+
+        parameters = {
+            "file": file_url,
+            "batchSize": batch_size,
+            "concurrency": concurrency,
+            "types": types,
+            "loadConfig": load_config,
+        }
+
+        try:
+            self.connection.execute_query(_Q_IMPORT_CREATE_INDEX)
+            node_result = self.connection.execute_query(_Q_IMPORT_NODES_STREAMED, parameters)
+            rel_result = self.connection.execute_query(_Q_IMPORT_RELS_STREAMED, parameters)
+            stats = {
+                "nodes": node_result[0]["total"] if node_result else 0,
+                "relationships": rel_result[0]["total"] if rel_result else 0,
+                "time_ms": int((time.monotonic() - started) * 1000),
+            }
+            logger.info(
+                f"Streamed import of {stats['nodes']} nodes and "
+                f"{stats['relationships']} relationships in {stats['time_ms']}ms "
+                f"(batch_size={batch_size}, concurrency={concurrency})"
+            )
+            return stats
+        except Exception as e:
+            logger.error(f"Streamed import failed: {e}")
+            raise
+        finally:
+            # Strip the import scaffolding even on partial failure so no
+            # :_Import labels or the temporary index leak into the database
+            try:
+                self.connection.execute_query(
+                    _Q_IMPORT_STRIP_SCAFFOLDING, {"batchSize": batch_size}
+                )
+                self.connection.execute_query(_Q_IMPORT_DROP_INDEX)
+            except Exception as cleanup_error:
+                logger.warning(f"Import scaffolding cleanup failed: {cleanup_error}")
+
     def list_backups(self) -> list[Path]:
         """
         List all backup files in backup directory.
 
+        The scan is cached against the directory mtime, so repeat calls in a
+        backup loop cost one stat() instead of a glob plus a stat per file.
+
         Returns:
-            List of backup file paths
+            List of backup file paths, oldest first
         """
-        return sorted(self.backup_dir.glob("*.graphml*"), key=lambda p: p.stat().st_mtime)
+        dir_mtime = self.backup_dir.stat().st_mtime_ns
+        if self._listing_cache and self._listing_cache[0] == dir_mtime:
+            return self._listing_cache[1]
+
+        # scandir returns dirents with stat info in one pass; keep the scan
+        # as plain (name, mtime) tuples and only build Paths at the boundary
+        with os.scandir(self.backup_dir) as it:
+            entries = [
+                (entry.name, entry.stat().st_mtime)
+                for entry in it
+                if entry.is_file()
+                and (entry.name.endswith(".graphml") or ".graphml." in entry.name)
+            ]
+        entries.sort(key=operator.itemgetter(1))
+
+        backups = [self.backup_dir / name for name, _ in entries]
+        self._listing_cache = (dir_mtime, backups)
+        return backups
 
     def get_latest_backup(self) -> Optional[Path]:
         """
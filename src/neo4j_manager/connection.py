@@ -1,12 +1,42 @@
 """Neo4j connection management."""
 
+from __future__ import annotations
+
 import logging
-from typing import Optional, Any, Dict, List
-from neo4j import GraphDatabase, Driver
-from neo4j.exceptions import ServiceUnavailable, AuthError
+import os
+import re
+import threading
+from typing import TYPE_CHECKING, Final, Optional, Any, Dict, Iterator, List, Tuple
+
+# The neo4j driver tree is expensive to import (~200 ms cold), so it is only
+# loaded when a connection is actually made; see the local imports below.
+if TYPE_CHECKING:
+    from neo4j import Driver
 
 logger = logging.getLogger(__name__)
 
+# Shared drivers keyed by (uri, username, password) with a reference count.
+# Creating a Driver is expensive (bolt handshake, TLS, pool threads), so all
+# Neo4jConnection instances with the same credentials share one driver.
+_DRIVER_CACHE: Dict[Tuple[str, str, str], Tuple[Driver, int]] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Labels and relationship types cannot be parameterized in Cypher, so bulk
+# helpers interpolate them after validating against this identifier pattern.
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Hot-path Cypher hoisted to constants: stable string objects give the
+# driver's query-cache lookup a stable hash, and the queries read better here
+_Q_PING: Final = "RETURN 1"
+_Q_NODE_COUNT: Final = "MATCH (n) RETURN count(n) as count"
+_Q_REL_COUNT: Final = "MATCH ()-[r]->() RETURN count(r) as count"
+_Q_CLEAR: Final = "MATCH (n) DETACH DELETE n"
+_Q_CLEAR_BATCHED: Final = (
+    "CALL apoc.periodic.iterate("
+    "'MATCH (n) RETURN n', 'DETACH DELETE n', "
+    "{batchSize: 10000, parallel: false})"
+)
+
 
 class Neo4jConnection:
     """Manages Neo4j database connections."""
@@ -16,24 +46,52 @@ class Neo4jConnection:
         uri: str = "bolt://localhost:7687",
         username: str = "neo4j",
         password: str = "yourpassword",
+        database: str = "neo4j",
+        max_connection_pool_size: Optional[int] = None,
+        connection_acquisition_timeout: float = 30.0,
+        max_connection_lifetime: float = 3600.0,
     ):
         """
         Initialize Neo4j connection.
 
+        Pool tuning only takes effect when this connection actually creates
+        the driver; connections that join an already-cached driver inherit
+        its configuration.
+
         Args:
             uri: Neo4j bolt URI
             username: Database username
             password: Database password
+            database: Target database name
+            max_connection_pool_size: Bolt pool size (default: NEO4J_POOL_SIZE
+                env var, falling back to 50)
+            connection_acquisition_timeout: Seconds to wait for a pool slot
+            max_connection_lifetime: Seconds before pooled connections are
+                recycled
         """
         self.uri = uri
         self.username = username
         self.password = password
+        self.database = database
+        if max_connection_pool_size is None:
+            max_connection_pool_size = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+        self.max_connection_lifetime = max_connection_lifetime
         self._driver: Optional[Driver] = None
 
-    def connect(self) -> Driver:
+    def connect(self, verify: bool = True) -> Driver:
         """
         Establish connection to Neo4j.
 
+        Reuses a shared driver from the module-level cache when one already
+        exists for this (uri, username, password), creating it only on miss.
+
+        Args:
+            verify: Run verify_connectivity on newly created drivers. Pass
+                False when reachability is already established elsewhere
+                (e.g. a session-scoped health probe) to save a roundtrip.
+
         Returns:
             Neo4j driver instance
 
@@ -41,26 +99,105 @@ class Neo4jConnection:
             ServiceUnavailable: If Neo4j is not reachable
             AuthError: If authentication fails
         """
-        try:
-            self._driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
-            # Verify connectivity
-            self._driver.verify_connectivity()
-            logger.info(f"Connected to Neo4j at {self.uri}")
+        from neo4j import GraphDatabase
+        from neo4j.exceptions import ServiceUnavailable, AuthError
+
+        if self._driver:
             return self._driver
+
+        key = (self.uri, self.username, self.password)
+        with _CACHE_LOCK:
+            cached = _DRIVER_CACHE.get(key)
+            if cached is not None:
+                driver, refcount = cached
+                _DRIVER_CACHE[key] = (driver, refcount + 1)
+                self._driver = driver
+                return self._driver
+
+        # Create and verify the driver outside the lock: verification and the
+        # pre-warm ping are network I/O and must not stall other threads'
+        # connect()/close() calls
+        driver = GraphDatabase.driver(
+            self.uri,
+            auth=(self.username, self.password),
+            max_connection_pool_size=self.max_connection_pool_size,
+            connection_acquisition_timeout=self.connection_acquisition_timeout,
+            connection_timeout=10,
+            max_connection_lifetime=self.max_connection_lifetime,
+            keep_alive=True,
+        )
+        try:
+            # Verify connectivity only for newly created drivers
+            if verify:
+                driver.verify_connectivity()
+            # Pre-warm the pool so the first real query doesn't pay
+            # the TCP+TLS+HELLO cost. The system database rejects
+            # plain Cypher like RETURN 1, so skip the ping there.
+            if self.database != "system":
+                driver.execute_query(_Q_PING, database_=self.database)
         except ServiceUnavailable as e:
             logger.error(f"Neo4j service unavailable at {self.uri}: {e}")
+            driver.close()
             raise
         except AuthError as e:
             logger.error(f"Authentication failed for user {self.username}: {e}")
+            driver.close()
             raise
+        except Exception:
+            driver.close()
+            raise
+
+        with _CACHE_LOCK:
+            cached = _DRIVER_CACHE.get(key)
+            if cached is not None:
+                # Another thread connected with the same credentials while we
+                # were verifying; keep its driver and discard ours
+                driver.close()
+                driver, refcount = cached
+                _DRIVER_CACHE[key] = (driver, refcount + 1)
+            else:
+                _DRIVER_CACHE[key] = (driver, 1)
+                logger.info(f"Connected to Neo4j at {self.uri}")
+        self._driver = driver
+        return self._driver
 
     def close(self) -> None:
-        """Close Neo4j connection."""
+        """
+        Close Neo4j connection.
+
+        Decrements the shared driver's reference count; the underlying driver
+        is only closed once no other Neo4jConnection is using it.
+        """
         if self._driver:
-            self._driver.close()
+            key = (self.uri, self.username, self.password)
+            with _CACHE_LOCK:
+                cached = _DRIVER_CACHE.get(key)
+                if cached and cached[0] is self._driver:
+                    driver, refcount = cached
+                    if refcount <= 1:
+                        del _DRIVER_CACHE[key]
+                        driver.close()
+                    else:
+                        _DRIVER_CACHE[key] = (driver, refcount - 1)
+                else:
+                    # Driver was not cached (e.g. set directly); close it outright
+                    self._driver.close()
             logger.info("Neo4j connection closed")
             self._driver = None
 
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """
+        Close all cached drivers regardless of reference counts.
+
+        Intended for process/test-session teardown where no further
+        connections will be made.
+        """
+        with _CACHE_LOCK:
+            for driver, _ in _DRIVER_CACHE.values():
+                driver.close()
+            _DRIVER_CACHE.clear()
+
     @property
     def driver(self) -> Driver:
         """
@@ -73,8 +210,28 @@ class Neo4jConnection:
             return self.connect()
         return self._driver
 
+    @staticmethod
+    def _build_query(query: str, timeout: Optional[float], op: Optional[str]):
+        """
+        Wrap a Cypher string in neo4j.Query when a timeout or op is requested.
+
+        The metadata shows up in server-side query logs, so slow queries can
+        be attributed to their caller; the timeout bounds runaway queries.
+        Plain strings pass through untouched to keep the happy path cheap.
+        """
+        if timeout is None and op is None:
+            return query
+
+        from neo4j import Query
+
+        return Query(query, metadata={"app": "neo4j_manager", "op": op or "adhoc"}, timeout=timeout)
+
     def execute_query(
-        self, query: str, parameters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        op: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Execute a Cypher query.
@@ -82,34 +239,191 @@ class Neo4jConnection:
         Args:
             query: Cypher query string
             parameters: Query parameters
+            timeout: Transaction timeout in seconds (None for server default)
+            op: Operation name recorded in query metadata for server logs
 
         Returns:
             List of result records as dictionaries
         """
-        with self.driver.session() as session:
-            result = session.run(query, parameters or {})
-            return [dict(record) for record in result]
+        from neo4j import Result
+
+        # Result.data consumes the whole result in the driver's bulk path,
+        # skipping a Python-level per-record conversion loop
+        return self.driver.execute_query(
+            self._build_query(query, timeout, op),
+            parameters or {},
+            database_=self.database,
+            result_transformer_=Result.data,
+        )
+
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        op: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a Cypher query and stream results lazily.
+
+        Yields records one at a time as Bolt frames arrive, so memory stays
+        O(1) regardless of result size. Prefer this over execute_query for
+        large reads.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            timeout: Transaction timeout in seconds (None for server default)
+            op: Operation name recorded in query metadata for server logs
+
+        Yields:
+            Result records as dictionaries
+        """
+        with self.driver.session(database=self.database) as session:
+            for record in session.run(self._build_query(query, timeout, op), parameters or {}):
+                yield record.data()
 
     def execute_write(
-        self, query: str, parameters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        op: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Execute a write query in a transaction.
 
+        Runs through the driver's managed transaction-function machinery
+        (driver.execute_query with write routing), so transient failures —
+        deadlocks, leader switches — are retried automatically and pooled
+        connections are reused across retries.
+
         Args:
             query: Cypher query string
             parameters: Query parameters
+            timeout: Transaction timeout in seconds (None for server default)
+            op: Operation name recorded in query metadata for server logs
 
         Returns:
             List of result records as dictionaries
         """
+        from neo4j import Result, RoutingControl
+
+        return self.driver.execute_query(
+            self._build_query(query, timeout, op),
+            parameters or {},
+            database_=self.database,
+            routing_=RoutingControl.WRITE,
+            result_transformer_=Result.data,
+        )
+
+    def execute_many(
+        self,
+        query: str,
+        params_list: List[Dict[str, Any]],
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Execute one query with many parameter sets in a single transaction.
 
-        def _write_tx(tx):
-            result = tx.run(query, parameters or {})
-            return [dict(record) for record in result]
+        Opens one session and runs every parameter set against the same
+        transaction, so N executions cost one session acquisition and one
+        commit instead of N. All-or-nothing: a failure rolls back every run.
 
-        with self.driver.session() as session:
-            return session.execute_write(_write_tx)
+        Args:
+            query: Cypher query string
+            params_list: One parameter dictionary per execution
+
+        Returns:
+            One result-record list per parameter set, in input order
+        """
+        results: List[List[Dict[str, Any]]] = []
+        with self.driver.session(database=self.database) as session:
+            with session.begin_transaction() as tx:
+                for params in params_list:
+                    results.append([record.data() for record in tx.run(query, params or {})])
+                tx.commit()
+        return results
+
+    def bulk_create(self, label: str, rows: List[Dict[str, Any]], batch_size: int = 10_000) -> int:
+        """
+        Create nodes in bulk with batched UNWIND statements.
+
+        Far faster than per-row execute_write calls: all batches run inside
+        one transaction, each batch as a single UNWIND ... CREATE statement.
+
+        Args:
+            label: Node label (validated as a plain identifier)
+            rows: Property dictionaries, one per node
+            batch_size: Rows per UNWIND batch
+
+        Returns:
+            Number of nodes created
+
+        Raises:
+            ValueError: If label is not a valid identifier
+        """
+        if not _IDENTIFIER_PATTERN.match(label):
+            raise ValueError(f"Invalid label: {label!r}")
+        if not rows:
+            return 0
+
+        query = f"UNWIND $rows AS row CREATE (n:`{label}`) SET n = row"
+        with self.driver.session(database=self.database) as session:
+            with session.begin_transaction() as tx:
+                for i in range(0, len(rows), batch_size):
+                    tx.run(query, rows=rows[i : i + batch_size])
+                tx.commit()
+        logger.info(f"Bulk created {len(rows)} :{label} nodes (batch_size={batch_size})")
+        return len(rows)
+
+    def bulk_merge_relationships(
+        self,
+        rel_type: str,
+        triples: List[Dict[str, Any]],
+        label: str,
+        key: str = "name",
+        batch_size: int = 10_000,
+    ) -> int:
+        """
+        Merge relationships in bulk with batched UNWIND statements.
+
+        Each triple is a dict with 'start' and 'end' values matched against
+        the `key` property of `label` nodes, plus an optional 'properties'
+        dict applied to the relationship.
+
+        Args:
+            rel_type: Relationship type (validated as a plain identifier)
+            triples: Dicts with 'start', 'end', and optional 'properties'
+            label: Label of the endpoint nodes
+            key: Node property used to match endpoints
+            batch_size: Triples per UNWIND batch
+
+        Returns:
+            Number of relationships merged
+
+        Raises:
+            ValueError: If rel_type, label, or key is not a valid identifier
+        """
+        for identifier in (rel_type, label, key):
+            if not _IDENTIFIER_PATTERN.match(identifier):
+                raise ValueError(f"Invalid identifier: {identifier!r}")
+        if not triples:
+            return 0
+
+        query = (
+            f"UNWIND $rows AS row "
+            f"MATCH (a:`{label}` {{`{key}`: row.start}}) "
+            f"MATCH (b:`{label}` {{`{key}`: row.end}}) "
+            f"MERGE (a)-[r:`{rel_type}`]->(b) "
+            f"SET r += coalesce(row.properties, {{}})"
+        )
+        with self.driver.session(database=self.database) as session:
+            with session.begin_transaction() as tx:
+                for i in range(0, len(triples), batch_size):
+                    tx.run(query, rows=triples[i : i + batch_size])
+                tx.commit()
+        logger.info(f"Bulk merged {len(triples)} :{rel_type} relationships")
+        return len(triples)
 
     def get_node_count(self) -> int:
         """
@@ -118,8 +432,8 @@ class Neo4jConnection:
         Returns:
             Node count
         """
-        result = self.execute_query("MATCH (n) RETURN count(n) as count")
-        return result[0]["count"] if result else 0
+        record = next(self.stream_query(_Q_NODE_COUNT, timeout=5.0, op="node_count"), None)
+        return record["count"] if record else 0
 
     def get_relationship_count(self) -> int:
         """
@@ -128,17 +442,24 @@ class Neo4jConnection:
         Returns:
             Relationship count
         """
-        result = self.execute_query("MATCH ()-[r]->() RETURN count(r) as count")
-        return result[0]["count"] if result else 0
+        record = next(self.stream_query(_Q_REL_COUNT, timeout=5.0, op="relationship_count"), None)
+        return record["count"] if record else 0
 
     def clear_database(self) -> None:
         """
         Clear all nodes and relationships from database.
 
+        Large databases are deleted in batches via apoc.periodic.iterate so
+        the delete set never has to fit in a single transaction heap; small
+        databases use a plain single-statement delete.
+
         Warning: This is a destructive operation!
         """
         logger.warning("Clearing all data from database")
-        self.execute_write("MATCH (n) DETACH DELETE n")
+        if self.get_node_count() < 10_000:
+            self.execute_write(_Q_CLEAR)
+        else:
+            self.execute_write(_Q_CLEAR_BATCHED)
 
     def __enter__(self):
         """Context manager entry."""
@@ -1,13 +1,25 @@
 """Health check utilities for Neo4j."""
 
 import logging
+import random
 import time
-from typing import Dict, Any
-from neo4j.exceptions import ServiceUnavailable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Final, Optional
 from .connection import Neo4jConnection
 
 logger = logging.getLogger(__name__)
 
+# Health-check Cypher hoisted to constants for stable query-cache keys
+_Q_PING: Final = "RETURN 1"
+_Q_APOC_VERSION: Final = "RETURN apoc.version() as version"
+_Q_SERVER_VERSION: Final = "CALL dbms.components() YIELD versions RETURN versions[0] as version"
+_Q_DATABASE_STATS: Final = """
+            CALL { MATCH (n) RETURN count(n) AS node_count }
+            CALL { MATCH ()-[r]->() RETURN count(r) AS relationship_count }
+            CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels }
+            RETURN node_count, relationship_count, labels
+            """
+
 
 class HealthChecker:
     """Health check utilities for Neo4j database."""
@@ -20,47 +32,93 @@ class HealthChecker:
             connection: Neo4j connection instance
         """
         self.connection = connection
+        # APOC install state and server version don't change while the
+        # process is alive, so both checks are memoized after the first call.
+        self._apoc_available: Optional[bool] = None
+        self._version: Optional[str] = None
+        self._cached_driver_id: Optional[int] = None
+
+    def invalidate_cache(self) -> None:
+        """Clear memoized APOC availability and version results."""
+        self._apoc_available = None
+        self._version = None
+
+    def _refresh_cache_epoch(self) -> None:
+        """Invalidate memoized results if the connection's driver changed.
+
+        A reconnect may target a different server (or a restarted one with
+        different plugins), so cached answers are only trusted while the
+        same driver object is in place.
+        """
+        driver_id = id(getattr(self.connection, "_driver", None))
+        if driver_id != self._cached_driver_id:
+            self._cached_driver_id = driver_id
+            self.invalidate_cache()
 
     def check_connectivity(self) -> bool:
         """
         Check if Neo4j is reachable.
 
+        Runs a trivial auto-commit query on a pooled session rather than
+        verify_connectivity(), which pays a full HELLO/RESET round-trip on
+        every call. A plain session is used instead of the managed
+        transaction path because that path retries ServiceUnavailable
+        internally (30s by default), which would stall every probe against
+        a down server and defeat wait_for_ready's own backoff and deadline.
+
         Returns:
             True if connected, False otherwise
         """
+        from neo4j.exceptions import ServiceUnavailable
+
         try:
-            self.connection.driver.verify_connectivity()
+            with self.connection.driver.session(database=self.connection.database) as session:
+                session.run(_Q_PING).consume()
             return True
-        except ServiceUnavailable:
+        except (ServiceUnavailable, OSError):
             return False
 
     def check_apoc_available(self) -> bool:
         """
         Check if APOC plugin is available.
 
+        Result is memoized; call invalidate_cache() to force a re-check.
+
         Returns:
             True if APOC is available, False otherwise
         """
+        self._refresh_cache_epoch()
+        if self._apoc_available is not None:
+            return self._apoc_available
+
         try:
-            result = self.connection.execute_query(
-                "CALL apoc.help('version') YIELD name RETURN count(name) as count"
-            )
-            return result[0]["count"] > 0 if result else False
+            # apoc.version() is a constant-time function, unlike apoc.help
+            # which scans the whole procedure registry
+            result = self.connection.execute_query(_Q_APOC_VERSION, timeout=2.0, op="apoc_check")
+            self._apoc_available = bool(result and result[0]["version"])
         except Exception as e:
             logger.error(f"APOC check failed: {e}")
-            return False
+            self._apoc_available = False
+        return self._apoc_available
 
     def get_version(self) -> str:
         """
         Get Neo4j version.
 
+        Result is memoized; call invalidate_cache() to force a re-check.
+
         Returns:
             Neo4j version string
         """
-        result = self.connection.execute_query(
-            "CALL dbms.components() YIELD versions RETURN versions[0] as version"
-        )
-        return result[0]["version"] if result else "unknown"
+        self._refresh_cache_epoch()
+        if self._version is not None:
+            return self._version
+
+        result = self.connection.execute_query(_Q_SERVER_VERSION, timeout=2.0, op="version_check")
+        if result:
+            self._version = result[0]["version"]
+            return self._version
+        return "unknown"
 
     def get_database_stats(self) -> Dict[str, Any]:
         """
@@ -69,39 +127,51 @@ class HealthChecker:
         Returns:
             Dictionary with node count, relationship count, and labels
         """
-        node_count = self.connection.get_node_count()
-        rel_count = self.connection.get_relationship_count()
-
-        # Get all labels
-        labels_result = self.connection.execute_query(
-            "CALL db.labels() YIELD label RETURN collect(label) as labels"
-        )
-        labels = labels_result[0]["labels"] if labels_result else []
+        # Fetch counts and labels in a single round-trip instead of three
+        result = self.connection.execute_query(_Q_DATABASE_STATS, timeout=5.0, op="database_stats")
+        if not result:
+            return {"node_count": 0, "relationship_count": 0, "labels": []}
 
         return {
-            "node_count": node_count,
-            "relationship_count": rel_count,
-            "labels": labels,
+            "node_count": result[0]["node_count"],
+            "relationship_count": result[0]["relationship_count"],
+            "labels": result[0]["labels"],
         }
 
-    def wait_for_ready(self, timeout: int = 60, interval: int = 2) -> bool:
+    def wait_for_ready(
+        self,
+        timeout: int = 60,
+        interval: int = 2,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
+    ) -> bool:
         """
         Wait for Neo4j to be ready.
 
+        Polls with exponential backoff (starting at 50 ms, capped at
+        `interval`) plus ±20% jitter, so quick startups are detected fast and
+        slow ones aren't hammered. Uses a monotonic clock for the deadline.
+
         Args:
             timeout: Maximum wait time in seconds
-            interval: Check interval in seconds
+            interval: Maximum delay between checks in seconds
+            clock: Monotonic time source (injectable for deterministic tests)
+            sleeper: Sleep function (injectable for deterministic tests)
 
         Returns:
             True if Neo4j becomes ready, False if timeout
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        delay = 0.05
+        start = clock()
+        deadline = start + timeout
+        while clock() < deadline:
             if self.check_connectivity():
                 logger.info("Neo4j is ready")
                 return True
-            logger.debug(f"Waiting for Neo4j... ({int(time.time() - start_time)}s)")
-            time.sleep(interval)
+            logger.debug(f"Waiting for Neo4j... ({int(clock() - start)}s)")
+            sleeper(delay * (0.8 + 0.4 * random.random()))
+            delay = min(delay * 2, interval)
 
         logger.error(f"Neo4j did not become ready within {timeout}s")
         return False
@@ -123,9 +193,15 @@ class HealthChecker:
         try:
             health["connected"] = self.check_connectivity()
             if health["connected"]:
-                health["apoc_available"] = self.check_apoc_available()
-                health["version"] = self.get_version()
-                health["stats"] = self.get_database_stats()
+                # The three server queries are independent, and the shared
+                # driver is thread-safe, so run them concurrently
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    apoc_future = executor.submit(self.check_apoc_available)
+                    version_future = executor.submit(self.get_version)
+                    stats_future = executor.submit(self.get_database_stats)
+                    health["apoc_available"] = apoc_future.result()
+                    health["version"] = version_future.result()
+                    health["stats"] = stats_future.result()
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             health["error"] = str(e)
@@ -3,6 +3,7 @@
 import os
 import pytest
 from dotenv import load_dotenv
+from neo4j.exceptions import AuthError, Neo4jError
 from src.neo4j_manager import Neo4jConnection, BackupManager, HealthChecker
 
 # Load environment variables
@@ -37,19 +38,61 @@ def neo4j_credentials(neo4j_uri, neo4j_username, neo4j_password):
     }
 
 
-@pytest.fixture
-def neo4j_connection(neo4j_uri, neo4j_username, neo4j_password):
-    """Create a Neo4j connection (function scope - new for each test)."""
-    connection = Neo4jConnection(uri=neo4j_uri, username=neo4j_username, password=neo4j_password)
+@pytest.fixture(scope="session")
+def neo4j_database(neo4j_uri, neo4j_username, neo4j_password):
+    """
+    Pick a per-xdist-worker database so parallel workers stay isolated.
+
+    Under `pytest -n auto --dist loadfile` each worker gets its own
+    database (e.g. "testgw0"), created on first use. Without xdist, or on
+    Community edition where CREATE DATABASE is unavailable, falls back to
+    the default database.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        return "neo4j"
+
+    database = f"test{worker}"
+    admin = Neo4jConnection(
+        uri=neo4j_uri, username=neo4j_username, password=neo4j_password, database="system"
+    )
+    try:
+        admin.connect()
+        admin.execute_query(f"CREATE DATABASE {database} IF NOT EXISTS WAIT")
+    except AuthError:
+        # AuthError is a Neo4jError subclass: bad credentials must fail
+        # loudly, not degrade into sharing the default database
+        raise
+    except Neo4jError:
+        # Community edition rejects CREATE DATABASE; share the single
+        # database rather than fail. Connectivity problems still propagate.
+        return "neo4j"
+    finally:
+        admin.close()
+    return database
+
+
+@pytest.fixture(scope="session")
+def neo4j_connection(neo4j_uri, neo4j_username, neo4j_password, neo4j_database):
+    """Create a Neo4j connection (session scope - one driver for the whole run)."""
+    connection = Neo4jConnection(
+        uri=neo4j_uri,
+        username=neo4j_username,
+        password=neo4j_password,
+        database=neo4j_database,
+    )
     yield connection
     connection.close()
+    Neo4jConnection.shutdown_all()
 
 
 @pytest.fixture
 def connected_neo4j(neo4j_connection):
-    """Create and connect to Neo4j."""
-    neo4j_connection.connect()
-    yield neo4j_connection
+    """Connect the session-scoped Neo4j connection (no-op if already connected)."""
+    # The pool pre-warm ping already proves reachability, so skip the
+    # separate verify_connectivity roundtrip
+    neo4j_connection.connect(verify=False)
+    return neo4j_connection
 
 
 @pytest.fixture
@@ -59,10 +102,10 @@ def clean_neo4j(connected_neo4j):
     Clears database before and after test.
     """
     # Clear before test
-    connected_neo4j.clear_database()
+    connected_neo4j.execute_write("MATCH (n) DETACH DELETE n")
     yield connected_neo4j
     # Clear after test
-    connected_neo4j.clear_database()
+    connected_neo4j.execute_write("MATCH (n) DETACH DELETE n")
 
 
 @pytest.fixture
@@ -72,9 +115,9 @@ def health_checker(neo4j_connection):
 
 
 @pytest.fixture
-def backup_manager(neo4j_connection):
-    """Create a BackupManager instance."""
-    return BackupManager(neo4j_connection, backup_dir="./tests/test_backups")
+def backup_manager(neo4j_connection, tmp_path):
+    """Create a BackupManager instance backed by a per-test temp directory."""
+    return BackupManager(neo4j_connection, backup_dir=str(tmp_path / "backups"))
 
 
 @pytest.fixture
@@ -94,16 +137,3 @@ def sample_graph_data():
         "expected_nodes": 4,
         "expected_relationships": 4,
     }
-
-
-@pytest.fixture(autouse=True)
-def cleanup_test_backups():
-    """Clean up test backup files after each test."""
-    yield
-    # Cleanup after test
-    import shutil
-    from pathlib import Path
-
-    test_backup_dir = Path("./tests/test_backups")
-    if test_backup_dir.exists():
-        shutil.rmtree(test_backup_dir)
@@ -37,20 +37,18 @@ class TestBackupRestoreWorkflow:
 
         # Verify we can generate a backup filename
         filename = backup_manager.create_backup_filename()
-        assert filename.endswith(".graphml")
-        assert len(filename) > len(".graphml")
+        assert filename.endswith(".graphml.gz")
+        assert len(filename) > len(".graphml.gz")
 
     def test_backup_filename_generation(self, backup_manager):
         """Test backup filename generation with timestamps."""
         filename1 = backup_manager.create_backup_filename()
         filename2 = backup_manager.create_backup_filename()
 
-        # Filenames should be unique (contain timestamps)
-        assert filename1.endswith(".graphml")
-        assert filename2.endswith(".graphml")
-
-        # Can have same timestamp if executed very quickly
-        # But format should be correct
+        # Filenames are unique even within the same second (sequence suffix)
+        assert filename1 != filename2
+        assert filename1.endswith(".graphml.gz")
+        assert filename2.endswith(".graphml.gz")
         assert "neo4j_backup_" in filename1
         assert "_" in filename1.split(".")[0]
 
@@ -205,15 +203,9 @@ class TestDataManipulationWorkflow:
             {"name": f"Person{i}", "age": 20 + i, "city": "TestCity"} for i in range(100)
         ]
 
-        # Step 2: Insert in batches using UNWIND
-        clean_neo4j.execute_write(
-            """
-            UNWIND $persons as person
-            CREATE (p:Person)
-            SET p = person
-        """,
-            {"persons": persons_data},
-        )
+        # Step 2: Insert in batches using the bulk helper
+        created = clean_neo4j.bulk_create("Person", persons_data, batch_size=50)
+        assert created == 100
 
         # Step 3: Verify insertion
         count = clean_neo4j.get_node_count()
@@ -289,7 +281,7 @@ class TestContextManagerWorkflow:
         # Connection should be closed automatically
         assert conn._driver is None
 
-    def test_nested_context_managers_workflow(self, neo4j_credentials):
+    def test_nested_context_managers_workflow(self, neo4j_credentials, tmp_path):
         """Test workflow with nested context managers."""
         with Neo4jConnection(**neo4j_credentials) as conn:
             conn.clear_database()
@@ -298,7 +290,7 @@ class TestContextManagerWorkflow:
             conn.execute_write("CREATE (p:Person {name: 'Test'})")
 
             # Create backup manager in nested context
-            backup_mgr = BackupManager(conn, "./tests/test_backups")
+            backup_mgr = BackupManager(conn, str(tmp_path / "backups"))
 
             # Verify operations work
             assert conn.get_node_count() == 1
@@ -0,0 +1,89 @@
+"""Integration-test fixtures.
+
+Overrides the global `clean_neo4j` with transaction-rollback isolation:
+each test runs inside one explicit transaction that is always rolled back,
+so teardown is O(1) instead of a full `DETACH DELETE` sweep before and
+after every test. Tests that genuinely need committed state (e.g. the
+rollback-on-error test) use `committed_neo4j`, which keeps the original
+destructive wipe behavior.
+"""
+
+import pytest
+
+from src.neo4j_manager import Neo4jConnection
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _require_neo4j(neo4j_credentials):
+    """
+    Skip the integration session when Neo4j is unreachable.
+
+    Probes once at session start instead of letting every test pay a
+    connect timeout before failing. The probe's driver stays in the
+    shared cache, pre-warmed for the session connection; session
+    teardown's shutdown_all() closes it.
+    """
+    probe = Neo4jConnection(**neo4j_credentials, connection_acquisition_timeout=5.0)
+    try:
+        probe.connect()
+    except Exception as e:
+        pytest.skip(f"Neo4j not available: {e}")
+
+
+@pytest.fixture(scope="session")
+def _session_clean_slate(neo4j_connection):
+    """
+    Wipe pre-existing committed data once per session.
+
+    Rollback isolation only hides a test's own writes; whatever was in the
+    database before the run would still be visible to tests asserting
+    absolute counts. One sweep up front makes "clean" actually mean empty
+    while keeping per-test teardown O(1).
+    """
+    neo4j_connection.connect(verify=False)
+    neo4j_connection.execute_write("MATCH (n) DETACH DELETE n")
+
+
+@pytest.fixture
+def clean_neo4j(connected_neo4j, monkeypatch, _session_clean_slate):
+    """
+    Provide a clean Neo4j database isolated by transaction rollback.
+
+    Routes execute_query/execute_write/stream_query through a single
+    explicit transaction so the test sees its own writes, then rolls the
+    transaction back on teardown — no cleanup query needed. A one-time
+    session sweep (`_session_clean_slate`) guarantees the starting state
+    is empty.
+    """
+    session = connected_neo4j.driver.session(database=connected_neo4j.database)
+    tx = session.begin_transaction()
+
+    def run_in_tx(query, parameters=None, timeout=None, op=None):
+        return [record.data() for record in tx.run(query, parameters or {})]
+
+    def stream_in_tx(query, parameters=None, timeout=None, op=None):
+        for record in tx.run(query, parameters or {}):
+            yield record.data()
+
+    monkeypatch.setattr(connected_neo4j, "execute_query", run_in_tx)
+    monkeypatch.setattr(connected_neo4j, "execute_write", run_in_tx)
+    monkeypatch.setattr(connected_neo4j, "stream_query", stream_in_tx)
+
+    yield connected_neo4j
+
+    if not tx.closed():
+        tx.rollback()
+    session.close()
+
+
+@pytest.fixture
+def committed_neo4j(connected_neo4j):
+    """
+    Provide a clean Neo4j database with real committed writes.
+
+    For tests that exercise commit/rollback semantics themselves and
+    cannot run inside the rollback wrapper. Clears before and after.
+    """
+    connected_neo4j.execute_write("MATCH (n) DETACH DELETE n")
+    yield connected_neo4j
+    connected_neo4j.execute_write("MATCH (n) DETACH DELETE n")
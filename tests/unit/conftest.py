@@ -0,0 +1,51 @@
+"""Shared fixtures for the unit test suite."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+
+class FakeConnection:
+    """
+    Lightweight stand-in for Neo4jConnection.
+
+    Mock(spec=Neo4jConnection) introspects the whole class on every
+    construction, and the unit suite builds dozens of them per run —
+    for tests doing microseconds of real work, spec building is the hot
+    path. This fake exposes the same query surface as plain Mocks with
+    no introspection; test_fake_connection_matches_real_interface pins
+    the attribute list against the real class.
+    """
+
+    METHODS = (
+        "connect",
+        "close",
+        "execute_query",
+        "execute_write",
+        "execute_many",
+        "stream_query",
+        "clear_database",
+        "get_node_count",
+        "get_relationship_count",
+    )
+
+    def __init__(self):
+        # MagicMock so `with driver.session(...)` works out of the box
+        self.driver = MagicMock(name="driver")
+        self.database = "neo4j"
+        for name in self.METHODS:
+            setattr(self, name, Mock(name=name))
+
+
+@pytest.fixture
+def mock_conn():
+    """Provide a fresh fake Neo4jConnection."""
+    return FakeConnection()
+
+
+@pytest.fixture
+def checker(mock_conn):
+    """Provide a HealthChecker wired to the fake connection."""
+    from src.neo4j_manager.health_check import HealthChecker
+
+    return HealthChecker(mock_conn)
@@ -4,123 +4,135 @@ from unittest.mock import Mock, MagicMock, patch
 from pathlib import Path
 import pytest
 from src.neo4j_manager.backup import BackupManager
-from src.neo4j_manager.connection import Neo4jConnection
 
 
 class TestBackupManagerInit:
     """Test BackupManager initialization."""
 
-    def test_init_with_defaults(self):
+    def test_init_with_defaults(self, mock_conn):
         """Test initialization with default parameters."""
-        mock_conn = Mock(spec=Neo4jConnection)
         manager = BackupManager(mock_conn)
 
         assert manager.connection == mock_conn
         assert manager.backup_dir == Path("./backup")
         assert manager.backup_dir.exists()
 
-    def test_init_with_custom_backup_dir(self):
+    def test_init_with_custom_backup_dir(self, mock_conn):
         """Test initialization with custom backup directory."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        manager = BackupManager(mock_conn, backup_dir="./custom_backup")
+        manager = BackupManager(mock_conn, backup_dir="./custom_backup", create_dir=False)
 
         assert manager.connection == mock_conn
         assert manager.backup_dir == Path("./custom_backup")
 
+    def test_init_without_create_dir(self, tmp_path, mock_conn):
+        """Test that create_dir=False skips directory creation."""
+        target = tmp_path / "backups"
+        BackupManager(mock_conn, backup_dir=str(target), create_dir=False)
+
+        assert not target.exists()
+
 
 class TestBackupFilenameGeneration:
     """Test backup filename generation."""
 
-    @patch("src.neo4j_manager.backup.datetime")
-    def test_create_backup_filename_default_prefix(self, mock_datetime):
+    @patch("src.neo4j_manager.backup.time")
+    def test_create_backup_filename_default_prefix(self, mock_time, mock_conn):
         """Test backup filename generation with default prefix."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_datetime.now.return_value.strftime.return_value = "20251026_143000"
+        mock_time.strftime.return_value = "20251026_143000"
 
-        manager = BackupManager(mock_conn)
+        manager = BackupManager(mock_conn, create_dir=False)
         filename = manager.create_backup_filename()
 
-        assert filename == "neo4j_backup_20251026_143000.graphml"
-        mock_datetime.now.return_value.strftime.assert_called_once_with("%Y%m%d_%H%M%S")
+        assert filename == "neo4j_backup_20251026_143000_0000.graphml.gz"
 
-    @patch("src.neo4j_manager.backup.datetime")
-    def test_create_backup_filename_custom_prefix(self, mock_datetime):
+    @patch("src.neo4j_manager.backup.time")
+    def test_create_backup_filename_custom_prefix(self, mock_time, mock_conn):
         """Test backup filename generation with custom prefix."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_datetime.now.return_value.strftime.return_value = "20251026_143000"
+        mock_time.strftime.return_value = "20251026_143000"
 
-        manager = BackupManager(mock_conn)
+        manager = BackupManager(mock_conn, create_dir=False)
         filename = manager.create_backup_filename(prefix="test_backup")
 
-        assert filename == "test_backup_20251026_143000.graphml"
+        assert filename == "test_backup_20251026_143000_0000.graphml.gz"
+
+    @patch("src.neo4j_manager.backup.time")
+    def test_create_backup_filename_unique_within_second(self, mock_time, mock_conn):
+        """Test that filenames generated in the same second don't collide."""
+        mock_time.strftime.return_value = "20251026_143000"
+
+        manager = BackupManager(mock_conn, create_dir=False)
+        filenames = {manager.create_backup_filename() for _ in range(3)}
+
+        assert len(filenames) == 3
 
 
 class TestExportToGraphML:
     """Test GraphML export functionality."""
 
-    def test_export_to_graphml_success(self):
+    def test_export_to_graphml_success(self, mock_conn):
         """Test successful GraphML export."""
-        mock_conn = Mock(spec=Neo4jConnection)
         mock_conn.execute_query.return_value = [
             {"file": "backup.graphml", "nodes": 100, "relationships": 50, "time": 1500}
         ]
 
-        manager = BackupManager(mock_conn, backup_dir="./test_backups")
+        manager = BackupManager(mock_conn, backup_dir="./test_backups", create_dir=False)
         result = manager.export_to_graphml(filename="test_backup.graphml")
 
-        assert result == str(manager.backup_dir / "test_backup.graphml")
+        assert result == str(manager.backup_dir / "test_backup.graphml.gz")
         mock_conn.execute_query.assert_called_once()
 
-        # Verify the query contains expected APOC call
-        call_args = mock_conn.execute_query.call_args[0][0]
-        assert "apoc.export.graphml.all" in call_args
-        assert "test_backup.graphml" in call_args
+        # Verify the query calls APOC with the filename as a parameter
+        query, parameters = mock_conn.execute_query.call_args[0]
+        assert "apoc.export.graphml.all" in query
+        assert parameters["file"] == "test_backup.graphml.gz"
+        assert parameters["config"]["compression"] == "GZIP"
 
-    def test_export_to_graphml_auto_filename(self):
+    def test_export_to_graphml_auto_filename(self, mock_conn):
         """Test export with auto-generated filename."""
-        mock_conn = Mock(spec=Neo4jConnection)
         mock_conn.execute_query.return_value = [
             {"file": "backup.graphml", "nodes": 50, "relationships": 25, "time": 1000}
         ]
 
-        manager = BackupManager(mock_conn, backup_dir="./test_backups")
+        manager = BackupManager(mock_conn, backup_dir="./test_backups", create_dir=False)
         result = manager.export_to_graphml()
 
-        assert result.endswith(".graphml")
+        assert result.endswith(".graphml.gz")
         assert "neo4j_backup_" in result
 
-    def test_export_to_graphml_with_types(self):
-        """Test export with type information enabled."""
-        mock_conn = Mock(spec=Neo4jConnection)
+    @pytest.mark.parametrize("include_types", [True, False])
+    def test_export_to_graphml_include_types(self, mock_conn, include_types):
+        """Test that the include_types flag lands in the APOC config."""
         mock_conn.execute_query.return_value = [
             {"file": "backup.graphml", "nodes": 10, "relationships": 5, "time": 500}
         ]
 
-        manager = BackupManager(mock_conn)
-        manager.export_to_graphml(include_types=True)
+        manager = BackupManager(mock_conn, create_dir=False)
+        manager.export_to_graphml(include_types=include_types)
 
-        call_args = mock_conn.execute_query.call_args[0][0]
-        assert "useTypes: true" in call_args
+        parameters = mock_conn.execute_query.call_args[0][1]
+        assert parameters["config"]["useTypes"] is include_types
 
-    def test_export_to_graphml_without_types(self):
-        """Test export with type information disabled."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_conn.execute_query.return_value = [
-            {"file": "backup.graphml", "nodes": 10, "relationships": 5, "time": 500}
-        ]
+    def test_export_query_text_stable_across_calls(self, mock_conn):
+        """Test that different filenames/flags reuse one query text.
 
-        manager = BackupManager(mock_conn)
-        manager.export_to_graphml(include_types=False)
+        Neo4j keys its plan cache on exact query text, so the filename and
+        useTypes flag must travel as parameters, never be interpolated.
+        """
+        mock_conn.execute_query.return_value = []
+        manager = BackupManager(mock_conn, create_dir=False)
 
-        call_args = mock_conn.execute_query.call_args[0][0]
-        assert "useTypes: false" in call_args
+        manager.export_to_graphml(filename="first.graphml", include_types=True)
+        manager.export_to_graphml(filename="second.graphml", include_types=False)
 
-    def test_export_to_graphml_failure(self):
+        queries = [call[0][0] for call in mock_conn.execute_query.call_args_list]
+        assert queries[0] == queries[1]
+        assert "first" not in queries[0] and "second" not in queries[1]
+
+    def test_export_to_graphml_failure(self, mock_conn):
         """Test export failure handling."""
-        mock_conn = Mock(spec=Neo4jConnection)
         mock_conn.execute_query.side_effect = Exception("APOC not available")
 
-        manager = BackupManager(mock_conn)
+        manager = BackupManager(mock_conn, create_dir=False)
 
         with pytest.raises(Exception) as exc_info:
             manager.export_to_graphml()
@@ -131,136 +143,309 @@ class TestExportToGraphML:
 class TestImportFromGraphML:
     """Test GraphML import functionality."""
 
-    @patch("src.neo4j_manager.backup.os.path.exists")
-    def test_import_from_graphml_success(self, mock_exists):
-        """Test successful GraphML import."""
-        mock_exists.return_value = True
-        mock_conn = Mock(spec=Neo4jConnection)
+    @staticmethod
+    def _stat_patch(size=1024):
+        """Patch Path.stat to report a file of `size` bytes.
+
+        Scoped as a context manager so Path operations outside the import
+        (e.g. BackupManager.__init__) still hit the real filesystem.
+        """
+        fake_stat = Mock()
+        fake_stat.st_size = size
+        return patch("src.neo4j_manager.backup.Path.stat", return_value=fake_stat)
+
+    @pytest.mark.parametrize("clear", [True, False])
+    def test_import_from_graphml_success(self, mock_conn, clear):
+        """Test GraphML import with and without clearing first."""
         mock_conn.execute_query.return_value = [{"nodes": 100, "relationships": 50, "time": 2000}]
+        manager = BackupManager(mock_conn, create_dir=False)
 
-        manager = BackupManager(mock_conn)
-        result = manager.import_from_graphml("/fake/path/backup.graphml")
+        with self._stat_patch():
+            result = manager.import_from_graphml("/fake/path/backup.graphml", clear_database=clear)
 
         assert result["nodes"] == 100
         assert result["relationships"] == 50
         assert result["time_ms"] == 2000
-        mock_conn.clear_database.assert_not_called()
+        assert mock_conn.clear_database.call_count == (1 if clear else 0)
+
+    def test_import_from_graphml_file_not_found(self, mock_conn):
+        """Test import with non-existent file."""
+        manager = BackupManager(mock_conn, create_dir=False)
 
-    @patch("src.neo4j_manager.backup.os.path.exists")
-    def test_import_from_graphml_with_clear(self, mock_exists):
-        """Test import with database clearing."""
-        mock_exists.return_value = True
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_conn.execute_query.return_value = [{"nodes": 50, "relationships": 25, "time": 1000}]
+        with patch("src.neo4j_manager.backup.Path.stat", side_effect=FileNotFoundError):
+            with pytest.raises(FileNotFoundError):
+                manager.import_from_graphml("/fake/path/nonexistent.graphml")
 
-        manager = BackupManager(mock_conn)
-        result = manager.import_from_graphml("/fake/path/backup.graphml", clear_database=True)
+    def test_import_from_graphml_failure(self, mock_conn):
+        """Test import failure handling."""
+        mock_conn.execute_query.side_effect = Exception("Import failed")
+        manager = BackupManager(mock_conn, create_dir=False)
 
-        mock_conn.clear_database.assert_called_once()
-        assert result["nodes"] == 50
+        with self._stat_patch():
+            with pytest.raises(Exception) as exc_info:
+                manager.import_from_graphml("/fake/path/backup.graphml")
 
-    @patch("src.neo4j_manager.backup.os.path.exists")
-    def test_import_from_graphml_file_not_found(self, mock_exists):
-        """Test import with non-existent file."""
-        mock_exists.return_value = False
-        mock_conn = Mock(spec=Neo4jConnection)
+        assert "Import failed" in str(exc_info.value)
 
-        manager = BackupManager(mock_conn)
+    def test_import_from_graphml_gzipped(self, mock_conn):
+        """Test that .gz backups pass GZIP compression to APOC."""
+        mock_conn.execute_query.return_value = [{"nodes": 10, "relationships": 5, "time": 100}]
+        manager = BackupManager(mock_conn, create_dir=False)
 
-        with pytest.raises(FileNotFoundError):
-            manager.import_from_graphml("/fake/path/nonexistent.graphml")
+        with self._stat_patch():
+            manager.import_from_graphml("/fake/path/backup.graphml.gz")
 
-    @patch("src.neo4j_manager.backup.os.path.exists")
-    def test_import_from_graphml_failure(self, mock_exists):
-        """Test import failure handling."""
-        mock_exists.return_value = True
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_conn.execute_query.side_effect = Exception("Import failed")
+        parameters = mock_conn.execute_query.call_args[0][1]
+        assert parameters["config"]["compression"] == "GZIP"
 
-        manager = BackupManager(mock_conn)
+    def test_import_from_graphml_huge_file_shrinks_batches(self, mock_conn):
+        """Test that files over 100 MB get a smaller transaction batch size."""
+        mock_conn.execute_query.return_value = [{"nodes": 10, "relationships": 5, "time": 100}]
+        manager = BackupManager(mock_conn, create_dir=False)
 
-        with pytest.raises(Exception) as exc_info:
+        with self._stat_patch(size=200 << 20):  # 200 MB
             manager.import_from_graphml("/fake/path/backup.graphml")
 
-        assert "Import failed" in str(exc_info.value)
+        parameters = mock_conn.execute_query.call_args[0][1]
+        assert parameters["config"]["batchSize"] == 1000
+
+    def test_import_from_graphml_parallel(self, mock_conn):
+        """Test streamed parallel import path."""
+        mock_conn.execute_query.side_effect = [
+            [{"name": "age", "type": "long"}],  # Key declarations
+            [],  # Create _import_id index
+            [{"total": 100, "failedBatches": 0}],  # Node phase
+            [{"total": 50, "failedBatches": 0}],  # Relationship phase
+            [{"total": 100, "failedBatches": 0}],  # Strip scaffolding
+            [],  # Drop index
+        ]
+        manager = BackupManager(mock_conn, create_dir=False)
+
+        with self._stat_patch():
+            result = manager.import_from_graphml("/fake/path/backup.graphml", parallel=True)
+
+        assert result["nodes"] == 100
+        assert result["relationships"] == 50
+        assert result["time_ms"] >= 0
+        assert mock_conn.execute_query.call_count == 6
+
+        # The node/relationship phases batch through apoc.periodic.iterate,
+        # with declared key types passed down for property casting
+        queries = [call[0][0] for call in mock_conn.execute_query.call_args_list]
+        assert "CREATE INDEX _import_id_idx" in queries[1]
+        for call in mock_conn.execute_query.call_args_list[2:4]:
+            query, parameters = call[0]
+            assert "apoc.periodic.iterate" in query
+            assert parameters["batchSize"] == 10_000
+            assert parameters["types"] == {"age": "long"}
+            # APOC's labels/label bookkeeping elements must not become
+            # properties on the imported nodes and relationships
+            assert "NOT d.key IN ['labels', 'label']" in query
+        assert "REMOVE n:_Import" in queries[4]
+        assert "DROP INDEX _import_id_idx" in queries[5]
+
+    def test_import_from_graphml_parallel_gzip(self, mock_conn):
+        """Test that the streamed path tells apoc.load.xml about gzip."""
+        mock_conn.execute_query.side_effect = [
+            [{"name": "age", "type": "long"}],
+            [],
+            [{"total": 100, "failedBatches": 0}],
+            [{"total": 50, "failedBatches": 0}],
+            [{"total": 100, "failedBatches": 0}],
+            [],
+        ]
+        manager = BackupManager(mock_conn, create_dir=False)
 
-    @patch("src.neo4j_manager.backup.os.path.exists")
-    def test_import_from_graphml_no_results(self, mock_exists):
+        with self._stat_patch():
+            manager.import_from_graphml("/fake/path/backup.graphml.gz", parallel=True)
+
+        # The default export format is gzipped, and apoc.load.xml doesn't
+        # sniff compression from the filename
+        _, key_parameters = mock_conn.execute_query.call_args_list[0][0]
+        assert key_parameters["config"] == {"compression": "GZIP"}
+        for call in mock_conn.execute_query.call_args_list[2:4]:
+            _, parameters = call[0]
+            assert parameters["loadConfig"] == {"compression": "GZIP"}
+
+    def test_import_from_graphml_no_results(self, mock_conn):
         """Test import when query returns no results."""
-        mock_exists.return_value = True
-        mock_conn = Mock(spec=Neo4jConnection)
         mock_conn.execute_query.return_value = []
+        manager = BackupManager(mock_conn, create_dir=False)
 
-        manager = BackupManager(mock_conn)
-        result = manager.import_from_graphml("/fake/path/backup.graphml")
+        with self._stat_patch():
+            result = manager.import_from_graphml("/fake/path/backup.graphml")
 
         assert result == {"nodes": 0, "relationships": 0, "time_ms": 0}
 
 
+class TestExportToCSV:
+    """Test CSV export functionality."""
+
+    def test_export_to_csv_success(self, mock_conn):
+        """Test successful CSV export."""
+        mock_conn.execute_query.return_value = [
+            {"file": "backup.csv", "nodes": 100, "relationships": 50, "time": 1200}
+        ]
+
+        manager = BackupManager(mock_conn, backup_dir="./test_backups", create_dir=False)
+        result = manager.export_to_csv(filename="test_backup.csv")
+
+        assert result == str(manager.backup_dir / "test_backup.csv")
+        query, parameters = mock_conn.execute_query.call_args[0]
+        assert "apoc.export.csv.all" in query
+        assert parameters["file"] == "test_backup.csv"
+        assert parameters["config"]["bulkImport"] is True
+
+    def test_export_to_csv_auto_filename(self, mock_conn):
+        """Test that the auto-generated filename is plain .csv, not .csv.gz."""
+        mock_conn.execute_query.return_value = [
+            {"file": "backup.csv", "nodes": 100, "relationships": 50, "time": 1200}
+        ]
+
+        manager = BackupManager(mock_conn, backup_dir="./test_backups", create_dir=False)
+        result = manager.export_to_csv()
+
+        # The export config sets no compression, so the name must not
+        # inherit the .gz suffix from the GraphML naming scheme
+        assert result.endswith(".csv")
+        assert ".gz" not in result
+        assert "neo4j_backup_" in result
+        _, parameters = mock_conn.execute_query.call_args[0]
+        assert parameters["file"].endswith(".csv")
+
+
+class TestImportFromCSVAdmin:
+    """Test offline bulk import via neo4j-admin."""
+
+    @patch("src.neo4j_manager.backup.subprocess.run")
+    @patch("src.neo4j_manager.backup.Path.is_file")
+    def test_import_from_csv_admin_success(self, mock_is_file, mock_run, mock_conn):
+        """Test that neo4j-admin is invoked with the expected arguments."""
+        mock_is_file.return_value = True
+
+        manager = BackupManager(mock_conn, create_dir=False)
+        manager.import_from_csv_admin("nodes.csv", "rels.csv")
+
+        mock_run.assert_called_once()
+        command = mock_run.call_args[0][0]
+        assert command[:4] == ["neo4j-admin", "database", "import", "full"]
+        assert "nodes.csv" in command
+        assert "rels.csv" in command
+        assert mock_run.call_args[1]["check"] is True
+
+    @patch("src.neo4j_manager.backup.Path.is_file")
+    def test_import_from_csv_admin_missing_file(self, mock_is_file, mock_conn):
+        """Test import with non-existent input file."""
+        mock_is_file.return_value = False
+
+        manager = BackupManager(mock_conn, create_dir=False)
+
+        with pytest.raises(FileNotFoundError):
+            manager.import_from_csv_admin("missing_nodes.csv", "missing_rels.csv")
+
+
 class TestListBackups:
     """Test backup listing functionality."""
 
-    def test_list_backups_empty_directory(self):
+    def test_list_backups_empty_directory(self, tmp_path, mock_conn):
         """Test listing backups in empty directory."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        manager = BackupManager(mock_conn, backup_dir="./empty_test_backups")
-        manager.backup_dir.mkdir(exist_ok=True)
+        manager = BackupManager(mock_conn, backup_dir=str(tmp_path))
 
         backups = manager.list_backups()
 
         assert backups == []
 
-    @patch("pathlib.Path.glob")
-    def test_list_backups_with_files(self, mock_glob):
+    @staticmethod
+    def _mock_entry(name, mtime):
+        """Build a fake os.scandir dirent."""
+        entry = MagicMock()
+        entry.name = name
+        entry.path = f"./backup/{name}"
+        entry.is_file.return_value = True
+        entry.stat.return_value.st_mtime = mtime
+        return entry
+
+    @patch("src.neo4j_manager.backup.os.scandir")
+    def test_list_backups_with_files(self, mock_scandir, tmp_path, mock_conn):
         """Test listing backups with existing files."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        manager = BackupManager(mock_conn)
-
-        # Mock some backup files with stat info
-        mock_file1 = MagicMock(spec=Path)
-        mock_file1.stat.return_value.st_mtime = 1000
-        mock_file2 = MagicMock(spec=Path)
-        mock_file2.stat.return_value.st_mtime = 2000
-        mock_file3 = MagicMock(spec=Path)
-        mock_file3.stat.return_value.st_mtime = 1500
+        manager = BackupManager(mock_conn, backup_dir=str(tmp_path))
 
-        mock_glob.return_value = [mock_file1, mock_file2, mock_file3]
+        mock_scandir.return_value.__enter__.return_value = iter(
+            [
+                self._mock_entry("backup_a.graphml", 1000),
+                self._mock_entry("backup_b.graphml.gz", 2000),
+                self._mock_entry("backup_c.graphml", 1500),
+                self._mock_entry("unrelated.txt", 3000),
+            ]
+        )
 
         backups = manager.list_backups()
 
-        assert len(backups) == 3
-        mock_glob.assert_called_once_with("*.graphml*")
+        # Only backup files, sorted oldest first
+        assert [p.name for p in backups] == [
+            "backup_a.graphml",
+            "backup_c.graphml",
+            "backup_b.graphml.gz",
+        ]
+        mock_scandir.assert_called_once()
+
+    @patch("src.neo4j_manager.backup.os.scandir")
+    def test_list_backups_cached_until_directory_changes(self, mock_scandir, tmp_path, mock_conn):
+        """Test that repeat calls reuse the cached listing."""
+        manager = BackupManager(mock_conn, backup_dir=str(tmp_path))
+
+        mock_scandir.return_value.__enter__.return_value = iter(
+            [self._mock_entry("backup_a.graphml", 1000)]
+        )
+
+        first = manager.list_backups()
+        second = manager.list_backups()
+
+        assert first == second
+        # Directory mtime unchanged, so the scan only happened once
+        mock_scandir.assert_called_once()
 
 
 class TestGetLatestBackup:
     """Test getting latest backup."""
 
-    def test_get_latest_backup_empty(self):
+    def test_get_latest_backup_empty(self, tmp_path, mock_conn):
         """Test getting latest backup when none exist."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        manager = BackupManager(mock_conn, backup_dir="./empty_test_backups")
-        manager.backup_dir.mkdir(exist_ok=True)
+        manager = BackupManager(mock_conn, backup_dir=str(tmp_path))
 
         latest = manager.get_latest_backup()
 
         assert latest is None
 
-    @patch("pathlib.Path.glob")
-    def test_get_latest_backup_with_files(self, mock_glob):
+    @patch("src.neo4j_manager.backup.os.scandir")
+    def test_get_latest_backup_with_files(self, mock_scandir, tmp_path, mock_conn):
         """Test getting latest backup with existing files."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        manager = BackupManager(mock_conn)
+        manager = BackupManager(mock_conn, backup_dir=str(tmp_path))
 
-        # Mock backup files with different timestamps
-        mock_file1 = MagicMock(spec=Path)
-        mock_file1.stat.return_value.st_mtime = 1000
-        mock_file2 = MagicMock(spec=Path)
-        mock_file2.stat.return_value.st_mtime = 2000  # Latest
-        mock_file3 = MagicMock(spec=Path)
-        mock_file3.stat.return_value.st_mtime = 1500
+        mock_scandir.return_value.__enter__.return_value = iter(
+            [
+                TestListBackups._mock_entry("backup_old.graphml", 1000),
+                TestListBackups._mock_entry("backup_new.graphml", 2000),
+                TestListBackups._mock_entry("backup_mid.graphml", 1500),
+            ]
+        )
 
-        mock_glob.return_value = [mock_file1, mock_file2, mock_file3]
+        latest = manager.get_latest_backup()
 
+        assert latest is not None
+        assert latest.name == "backup_new.graphml"
+
+    @patch("src.neo4j_manager.backup.os.scandir")
+    def test_get_latest_backup_reuses_listing_cache(self, mock_scandir, tmp_path, mock_conn):
+        """Test that a list-then-latest sequence only scans the directory once."""
+        manager = BackupManager(mock_conn, backup_dir=str(tmp_path))
+
+        mock_scandir.return_value.__enter__.return_value = iter(
+            [TestListBackups._mock_entry("backup_a.graphml", 1000)]
+        )
+
+        backups = manager.list_backups()
         latest = manager.get_latest_backup()
 
-        assert latest == mock_file2
+        assert latest == backups[-1]
+        mock_scandir.assert_called_once()
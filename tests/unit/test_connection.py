@@ -6,6 +6,13 @@ from neo4j.exceptions import ServiceUnavailable, AuthError
 from src.neo4j_manager.connection import Neo4jConnection
 
 
+@pytest.fixture(autouse=True)
+def reset_driver_cache():
+    """Clear the shared driver cache so tests don't leak drivers into each other."""
+    yield
+    Neo4jConnection.shutdown_all()
+
+
 class TestNeo4jConnectionInit:
     """Test Neo4jConnection initialization."""
 
@@ -28,7 +35,7 @@ class TestNeo4jConnectionInit:
 class TestNeo4jConnectionConnect:
     """Test connection establishment."""
 
-    @patch("src.neo4j_manager.connection.GraphDatabase")
+    @patch("neo4j.GraphDatabase")
     def test_connect_success(self, mock_graphdb):
         """Test successful connection."""
         mock_driver = Mock()
@@ -39,11 +46,89 @@ class TestNeo4jConnectionConnect:
 
         assert driver == mock_driver
         mock_graphdb.driver.assert_called_once_with(
-            "bolt://localhost:7687", auth=("neo4j", "yourpassword")
+            "bolt://localhost:7687",
+            auth=("neo4j", "yourpassword"),
+            max_connection_pool_size=50,
+            connection_acquisition_timeout=30,
+            connection_timeout=10,
+            max_connection_lifetime=3600,
+            keep_alive=True,
         )
         mock_driver.verify_connectivity.assert_called_once()
+        # Pool is pre-warmed with a trivial query
+        mock_driver.execute_query.assert_called_once_with("RETURN 1", database_="neo4j")
+
+    @patch.dict("os.environ", {"NEO4J_POOL_SIZE": "10"})
+    @patch("neo4j.GraphDatabase")
+    def test_connect_pool_size_from_env(self, mock_graphdb):
+        """Test that NEO4J_POOL_SIZE overrides the default pool size."""
+        mock_driver = Mock()
+        mock_graphdb.driver.return_value = mock_driver
+
+        Neo4jConnection().connect()
+
+        assert mock_graphdb.driver.call_args[1]["max_connection_pool_size"] == 10
+
+    @patch("neo4j.GraphDatabase")
+    def test_connect_custom_pool_settings(self, mock_graphdb):
+        """Test that constructor pool tuning reaches GraphDatabase.driver."""
+        mock_driver = Mock()
+        mock_graphdb.driver.return_value = mock_driver
+
+        Neo4jConnection(
+            max_connection_pool_size=200,
+            connection_acquisition_timeout=60.0,
+            max_connection_lifetime=600.0,
+        ).connect()
+
+        kwargs = mock_graphdb.driver.call_args.kwargs
+        assert kwargs["max_connection_pool_size"] == 200
+        assert kwargs["connection_acquisition_timeout"] == 60.0
+        assert kwargs["max_connection_lifetime"] == 600.0
+
+    @patch("neo4j.GraphDatabase")
+    def test_connect_skip_verify(self, mock_graphdb):
+        """Test that connect(verify=False) skips the connectivity roundtrip."""
+        mock_driver = Mock()
+        mock_graphdb.driver.return_value = mock_driver
+
+        Neo4jConnection().connect(verify=False)
 
-    @patch("src.neo4j_manager.connection.GraphDatabase")
+        mock_driver.verify_connectivity.assert_not_called()
+        # The pool pre-warm still runs, so reachability is still exercised
+        mock_driver.execute_query.assert_called_once_with("RETURN 1", database_="neo4j")
+
+    @patch("neo4j.GraphDatabase")
+    def test_connect_system_database_skips_prewarm(self, mock_graphdb):
+        """Test that the pre-warm ping is skipped for the system database."""
+        mock_driver = Mock()
+        mock_graphdb.driver.return_value = mock_driver
+
+        # The system database rejects plain Cypher, so pinging it would fail
+        Neo4jConnection(database="system").connect()
+
+        mock_driver.verify_connectivity.assert_called_once()
+        mock_driver.execute_query.assert_not_called()
+
+    @patch("neo4j.GraphDatabase")
+    def test_connect_reuses_cached_driver(self, mock_graphdb):
+        """Test that connections with the same credentials share one driver."""
+        mock_driver = Mock()
+        mock_graphdb.driver.return_value = mock_driver
+
+        conn1 = Neo4jConnection()
+        conn2 = Neo4jConnection()
+
+        assert conn1.connect() is conn2.connect()
+        mock_graphdb.driver.assert_called_once()
+
+        # Driver stays open until the last user closes it
+        conn1.close()
+        mock_driver.close.assert_not_called()
+        conn2.close()
+        mock_driver.close.assert_called_once()
+
+    @patch("neo4j.GraphDatabase")
     def test_connect_service_unavailable(self, mock_graphdb):
         """Test connection failure when service is unavailable."""
         mock_driver = Mock()
@@ -54,7 +139,11 @@ class TestNeo4jConnectionConnect:
         with pytest.raises(ServiceUnavailable):
             conn.connect()
 
-    @patch("src.neo4j_manager.connection.GraphDatabase")
+        # The failed driver must not leak: it is closed and never cached
+        mock_driver.close.assert_called_once()
+        assert conn._driver is None
+
+    @patch("neo4j.GraphDatabase")
     def test_connect_auth_error(self, mock_graphdb):
         """Test connection failure with authentication error."""
         mock_driver = Mock()
@@ -65,52 +154,240 @@ class TestNeo4jConnectionConnect:
         with pytest.raises(AuthError):
             conn.connect()
 
+        mock_driver.close.assert_called_once()
+        assert conn._driver is None
+
+    @patch("neo4j.GraphDatabase")
+    def test_connect_closes_driver_when_prewarm_fails(self, mock_graphdb):
+        """Test that a pre-warm ping failure closes the new driver."""
+        mock_driver = Mock()
+        mock_driver.execute_query.side_effect = RuntimeError("ping failed")
+        mock_graphdb.driver.return_value = mock_driver
+
+        conn = Neo4jConnection()
+        with pytest.raises(RuntimeError):
+            conn.connect()
+
+        mock_driver.close.assert_called_once()
+        assert conn._driver is None
+
 
 class TestNeo4jConnectionQueries:
     """Test query execution methods."""
 
     def test_execute_query_structure(self):
         """Test execute_query returns proper structure."""
+        from neo4j import Result
+
         conn = Neo4jConnection()
         mock_driver = MagicMock()
-        mock_session = MagicMock()
-        mock_result = Mock()
-
-        # Mock record behavior
-        mock_record = {"name": "Alice", "age": 30}
-        mock_result.__iter__ = Mock(return_value=iter([mock_record]))
-
-        mock_session.run.return_value = mock_result
-        mock_driver.session.return_value.__enter__.return_value = mock_session
+        mock_driver.execute_query.return_value = [{"name": "Alice", "age": 30}]
         conn._driver = mock_driver
 
         result = conn.execute_query("MATCH (n) RETURN n")
 
-        assert isinstance(result, list)
-        mock_session.run.assert_called_once()
+        assert result == [{"name": "Alice", "age": 30}]
+        mock_driver.execute_query.assert_called_once()
+        # Records are consumed via the driver's bulk Result.data path
+        assert mock_driver.execute_query.call_args.kwargs["result_transformer_"] is Result.data
 
     def test_execute_query_with_parameters(self):
         """Test execute_query with parameters."""
+        from neo4j import Result
+
+        conn = Neo4jConnection()
+        mock_driver = MagicMock()
+        mock_driver.execute_query.return_value = []
+        conn._driver = mock_driver
+
+        params = {"name": "Alice"}
+        conn.execute_query("MATCH (n {name: $name}) RETURN n", params)
+
+        mock_driver.execute_query.assert_called_once_with(
+            "MATCH (n {name: $name}) RETURN n",
+            params,
+            database_="neo4j",
+            result_transformer_=Result.data,
+        )
+
+    def test_execute_query_with_timeout_wraps_in_query(self):
+        """Test that a timeout/op request produces a neo4j.Query with metadata."""
+        from neo4j import Query
+
+        conn = Neo4jConnection()
+        mock_driver = MagicMock()
+        mock_driver.execute_query.return_value = []
+        conn._driver = mock_driver
+
+        conn.execute_query("MATCH (n) RETURN n", timeout=5.0, op="node_count")
+
+        query_obj = mock_driver.execute_query.call_args[0][0]
+        assert isinstance(query_obj, Query)
+        assert query_obj.timeout == 5.0
+        assert query_obj.metadata == {"app": "neo4j_manager", "op": "node_count"}
+
+    def test_execute_write_uses_managed_write_routing(self):
+        """Test that writes go through the driver's managed write path.
+
+        driver.execute_query wraps the query in a retryable transaction
+        function, so routing it as WRITE is what buys automatic retry on
+        deadlocks and leader switches.
+        """
+        from neo4j import Result, RoutingControl
+
+        conn = Neo4jConnection()
+        mock_driver = MagicMock()
+        mock_driver.execute_query.return_value = [{"created": 1}]
+        conn._driver = mock_driver
+
+        result = conn.execute_write("CREATE (n:Person) RETURN 1 as created")
+
+        assert result == [{"created": 1}]
+        kwargs = mock_driver.execute_query.call_args.kwargs
+        assert kwargs["routing_"] is RoutingControl.WRITE
+        assert kwargs["result_transformer_"] is Result.data
+
+    def test_stream_query_yields_lazily(self):
+        """Test stream_query yields records one at a time."""
         conn = Neo4jConnection()
         mock_driver = MagicMock()
         mock_session = MagicMock()
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter([]))
 
-        mock_session.run.return_value = mock_result
+        records = []
+        for name in ("Alice", "Bob"):
+            record = Mock()
+            record.data.return_value = {"name": name}
+            records.append(record)
+        mock_session.run.return_value = iter(records)
         mock_driver.session.return_value.__enter__.return_value = mock_session
         conn._driver = mock_driver
 
-        params = {"name": "Alice"}
-        conn.execute_query("MATCH (n {name: $name}) RETURN n", params)
+        stream = conn.stream_query("MATCH (n) RETURN n.name as name")
+
+        # Nothing runs until iteration starts
+        mock_session.run.assert_not_called()
+        assert next(stream) == {"name": "Alice"}
+        assert next(stream) == {"name": "Bob"}
+        assert list(stream) == []
 
-        mock_session.run.assert_called_once_with("MATCH (n {name: $name}) RETURN n", params)
+
+class TestNeo4jConnectionBulk:
+    """Test bulk write helpers."""
+
+    def _mock_transaction(self, conn):
+        """Wire a mock driver/session/transaction chain onto the connection."""
+        mock_driver = MagicMock()
+        mock_tx = MagicMock()
+        mock_session = MagicMock()
+        mock_session.begin_transaction.return_value.__enter__.return_value = mock_tx
+        mock_driver.session.return_value.__enter__.return_value = mock_session
+        conn._driver = mock_driver
+        return mock_tx
+
+    def test_execute_many_single_transaction(self):
+        """Test that all parameter sets run in one shared transaction."""
+        conn = Neo4jConnection()
+        mock_tx = self._mock_transaction(conn)
+        record = Mock()
+        record.data.return_value = {"name": "Alice"}
+        mock_tx.run.return_value = [record]
+
+        results = conn.execute_many(
+            "CREATE (p:Person {name: $name}) RETURN p.name as name",
+            [{"name": "Alice"}, {"name": "Bob"}, {"name": "Carol"}],
+        )
+
+        assert len(results) == 3
+        assert results[0] == [{"name": "Alice"}]
+        assert mock_tx.run.call_count == 3
+        mock_tx.commit.assert_called_once()
+
+    def test_bulk_create_batches_rows(self):
+        """Test that rows are chunked into batched UNWIND statements."""
+        conn = Neo4jConnection()
+        mock_tx = self._mock_transaction(conn)
+
+        rows = [{"name": f"Person{i}"} for i in range(25)]
+        created = conn.bulk_create("Person", rows, batch_size=10)
+
+        assert created == 25
+        assert mock_tx.run.call_count == 3  # 10 + 10 + 5
+        query = mock_tx.run.call_args[0][0]
+        assert "UNWIND $rows AS row" in query
+        assert "CREATE (n:`Person`)" in query
+        mock_tx.commit.assert_called_once()
+
+    def test_bulk_create_empty_rows(self):
+        """Test bulk create with no rows is a no-op."""
+        conn = Neo4jConnection()
+        mock_tx = self._mock_transaction(conn)
+
+        assert conn.bulk_create("Person", []) == 0
+        mock_tx.run.assert_not_called()
+
+    def test_bulk_create_invalid_label(self):
+        """Test that a non-identifier label is rejected."""
+        conn = Neo4jConnection()
+
+        with pytest.raises(ValueError):
+            conn.bulk_create("Person` DETACH DELETE n //", [{"name": "Alice"}])
+
+    def test_bulk_merge_relationships(self):
+        """Test bulk relationship merging."""
+        conn = Neo4jConnection()
+        mock_tx = self._mock_transaction(conn)
+
+        triples = [{"start": "Alice", "end": "Bob", "properties": {"since": 2020}}]
+        merged = conn.bulk_merge_relationships("KNOWS", triples, label="Person")
+
+        assert merged == 1
+        query = mock_tx.run.call_args[0][0]
+        assert "MERGE (a)-[r:`KNOWS`]->(b)" in query
+        mock_tx.commit.assert_called_once()
+
+    def test_bulk_merge_relationships_invalid_type(self):
+        """Test that a non-identifier relationship type is rejected."""
+        conn = Neo4jConnection()
+
+        with pytest.raises(ValueError):
+            conn.bulk_merge_relationships("KNOWS`]->()", [], label="Person")
+
+
+class TestNeo4jConnectionClearDatabase:
+    """Test database clearing."""
+
+    def test_clear_database_small(self):
+        """Test that small databases use a single-statement delete."""
+        conn = Neo4jConnection()
+        mock_driver = MagicMock()
+        mock_driver.execute_query.return_value = []
+        conn._driver = mock_driver
+        conn.get_node_count = Mock(return_value=100)
+
+        conn.clear_database()
+
+        query = mock_driver.execute_query.call_args[0][0]
+        assert query == "MATCH (n) DETACH DELETE n"
+
+    def test_clear_database_large_uses_batches(self):
+        """Test that large databases delete in batches."""
+        conn = Neo4jConnection()
+        mock_driver = MagicMock()
+        mock_driver.execute_query.return_value = []
+        conn._driver = mock_driver
+        conn.get_node_count = Mock(return_value=1_000_000)
+
+        conn.clear_database()
+
+        query = mock_driver.execute_query.call_args[0][0]
+        assert "apoc.periodic.iterate" in query
+        assert "DETACH DELETE n" in query
 
 
 class TestNeo4jConnectionContextManager:
     """Test context manager functionality."""
 
-    @patch("src.neo4j_manager.connection.GraphDatabase")
+    @patch("neo4j.GraphDatabase")
     def test_context_manager(self, mock_graphdb):
         """Test using connection as context manager."""
         mock_driver = Mock()
@@ -122,7 +399,18 @@ class TestNeo4jConnectionContextManager:
             assert c == conn
             assert conn._driver is not None
 
+        # Exit must both close the driver and drop the local reference
         mock_driver.close.assert_called_once()
+        assert conn._driver is None
+
+
+class TestFakeConnectionInterface:
+    """Test the shared FakeConnection stand-in."""
+
+    def test_fake_connection_matches_real_interface(self, mock_conn):
+        """Test that every faked method exists on the real class."""
+        for name in type(mock_conn).METHODS:
+            assert callable(getattr(Neo4jConnection, name)), name
 
 
 class TestNeo4jConnectionClose:
@@ -1,17 +1,14 @@
 """Unit tests for HealthChecker class."""
 
-from unittest.mock import Mock, patch
 from neo4j.exceptions import ServiceUnavailable
 from src.neo4j_manager.health_check import HealthChecker
-from src.neo4j_manager.connection import Neo4jConnection
 
 
 class TestHealthCheckerInit:
     """Test HealthChecker initialization."""
 
-    def test_init(self):
+    def test_init(self, mock_conn):
         """Test initialization."""
-        mock_conn = Mock(spec=Neo4jConnection)
         checker = HealthChecker(mock_conn)
         assert checker.connection == mock_conn
 
@@ -19,26 +16,21 @@ class TestHealthCheckerInit:
 class TestHealthCheckerConnectivity:
     """Test connectivity checks."""
 
-    def test_check_connectivity_success(self):
+    def test_check_connectivity_success(self, mock_conn, checker):
         """Test successful connectivity check."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_driver = Mock()
-        mock_conn.driver = mock_driver
-
-        checker = HealthChecker(mock_conn)
         result = checker.check_connectivity()
 
         assert result is True
-        mock_driver.verify_connectivity.assert_called_once()
+        # The probe runs on a bare session, not the managed retry path
+        mock_conn.driver.session.assert_called_once_with(database="neo4j")
+        session = mock_conn.driver.session.return_value.__enter__.return_value
+        session.run.assert_called_once_with("RETURN 1")
+        mock_conn.execute_query.assert_not_called()
 
-    def test_check_connectivity_failure(self):
+    def test_check_connectivity_failure(self, mock_conn, checker):
         """Test failed connectivity check."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_driver = Mock()
-        mock_driver.verify_connectivity.side_effect = ServiceUnavailable("Failed")
-        mock_conn.driver = mock_driver
+        mock_conn.driver.session.side_effect = ServiceUnavailable("Failed")
 
-        checker = HealthChecker(mock_conn)
         result = checker.check_connectivity()
 
         assert result is False
@@ -47,46 +39,74 @@ class TestHealthCheckerConnectivity:
 class TestHealthCheckerApoc:
     """Test APOC availability checks."""
 
-    def test_check_apoc_available_success(self):
+    def test_check_apoc_available_success(self, mock_conn, checker):
         """Test APOC is available."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_conn.execute_query.return_value = [{"count": 1}]
+        mock_conn.execute_query.return_value = [{"version": "2025.09.0"}]
 
-        checker = HealthChecker(mock_conn)
         result = checker.check_apoc_available()
 
         assert result is True
 
-    def test_check_apoc_available_failure(self):
+    def test_check_apoc_available_failure(self, mock_conn, checker):
         """Test APOC is not available."""
-        mock_conn = Mock(spec=Neo4jConnection)
         mock_conn.execute_query.side_effect = Exception("APOC not found")
 
-        checker = HealthChecker(mock_conn)
         result = checker.check_apoc_available()
 
         assert result is False
 
+    def test_check_apoc_available_memoized(self, mock_conn, checker):
+        """Test that the APOC check only queries once."""
+        mock_conn.execute_query.return_value = [{"version": "2025.09.0"}]
+
+        assert checker.check_apoc_available() is True
+        assert checker.check_apoc_available() is True
+
+        mock_conn.execute_query.assert_called_once()
+
+        # Invalidation forces a fresh round-trip
+        checker.invalidate_cache()
+        checker.check_apoc_available()
+        assert mock_conn.execute_query.call_count == 2
+
+
+class TestHealthCheckerCacheEpoch:
+    """Test cache invalidation across reconnects."""
+
+    def test_reconnect_invalidates_memoized_results(self, mock_conn, checker):
+        """Test that swapping the underlying driver forces fresh checks."""
+        mock_conn.execute_query.return_value = [{"version": "2025.09.0"}]
+        mock_conn._driver = object()
+
+        assert checker.check_apoc_available() is True
+        assert checker.check_apoc_available() is True
+        assert mock_conn.execute_query.call_count == 1
+
+        # A reconnect replaces the driver, so the cached answer is stale
+        mock_conn._driver = object()
+        checker.check_apoc_available()
+        assert mock_conn.execute_query.call_count == 2
+
 
 class TestHealthCheckerVersion:
     """Test version retrieval."""
 
-    def test_get_version_success(self):
+    def test_get_version_success(self, mock_conn, checker):
         """Test getting Neo4j version."""
-        mock_conn = Mock(spec=Neo4jConnection)
         mock_conn.execute_query.return_value = [{"version": "2025.09.0"}]
 
-        checker = HealthChecker(mock_conn)
         version = checker.get_version()
 
         assert version == "2025.09.0"
 
-    def test_get_version_no_result(self):
+        # Memoized: a second call doesn't hit the database again
+        checker.get_version()
+        mock_conn.execute_query.assert_called_once()
+
+    def test_get_version_no_result(self, mock_conn, checker):
         """Test getting version when no result."""
-        mock_conn = Mock(spec=Neo4jConnection)
         mock_conn.execute_query.return_value = []
 
-        checker = HealthChecker(mock_conn)
         version = checker.get_version()
 
         assert version == "unknown"
@@ -95,74 +115,86 @@ class TestHealthCheckerVersion:
 class TestHealthCheckerStats:
     """Test database statistics."""
 
-    def test_get_database_stats(self):
+    def test_get_database_stats(self, mock_conn, checker):
         """Test getting database statistics."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_conn.get_node_count.return_value = 100
-        mock_conn.get_relationship_count.return_value = 50
-        mock_conn.execute_query.return_value = [{"labels": ["Person", "Company"]}]
+        mock_conn.execute_query.return_value = [
+            {"node_count": 100, "relationship_count": 50, "labels": ["Person", "Company"]}
+        ]
 
-        checker = HealthChecker(mock_conn)
         stats = checker.get_database_stats()
 
         assert stats["node_count"] == 100
         assert stats["relationship_count"] == 50
         assert stats["labels"] == ["Person", "Company"]
+        mock_conn.execute_query.assert_called_once()
+
+    def test_get_database_stats_no_result(self, mock_conn, checker):
+        """Test database statistics when query returns nothing."""
+        mock_conn.execute_query.return_value = []
+
+        stats = checker.get_database_stats()
+
+        assert stats == {"node_count": 0, "relationship_count": 0, "labels": []}
 
 
 class TestHealthCheckerWaitForReady:
     """Test wait for ready functionality."""
 
-    @patch("src.neo4j_manager.health_check.time.sleep")
-    def test_wait_for_ready_immediate(self, mock_sleep):
+    def test_wait_for_ready_immediate(self, mock_conn, checker):
         """Test when Neo4j is immediately ready."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_driver = Mock()
-        mock_conn.driver = mock_driver
+        sleeps = []
 
-        checker = HealthChecker(mock_conn)
-        result = checker.wait_for_ready(timeout=10, interval=1)
+        result = checker.wait_for_ready(timeout=10, interval=1, sleeper=sleeps.append)
 
         assert result is True
-        mock_sleep.assert_not_called()
+        assert sleeps == []
 
-    @patch("src.neo4j_manager.health_check.time.sleep")
-    @patch("src.neo4j_manager.health_check.time.time")
-    def test_wait_for_ready_timeout(self, mock_time, mock_sleep):
+    def test_wait_for_ready_timeout(self, mock_conn, checker):
         """Test timeout when Neo4j doesn't become ready."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_driver = Mock()
-        mock_driver.verify_connectivity.side_effect = ServiceUnavailable("Not ready")
-        mock_conn.driver = mock_driver
+        mock_conn.driver.session.side_effect = ServiceUnavailable("Not ready")
 
-        # Simulate time progression to force timeout
-        # Mock time to always return values that exceed timeout
-        time_values = [0.0, 5.0, 11.0]  # start, during, exceeded
-        mock_time.side_effect = iter(time_values * 10)  # Repeat to handle multiple calls
+        # Deterministic clock: start, one failed probe, then past the deadline
+        clock = iter([0.0, 5.0, 5.0, 11.0]).__next__
 
-        checker = HealthChecker(mock_conn)
-        result = checker.wait_for_ready(timeout=10, interval=1)
+        result = checker.wait_for_ready(timeout=10, interval=1, clock=clock, sleeper=lambda _: None)
 
         assert result is False
 
+    def test_wait_for_ready_backoff_caps_at_interval(self, mock_conn, checker):
+        """Test that the retry delay grows exponentially up to the interval cap."""
+        mock_conn.driver.session.side_effect = ServiceUnavailable("Not ready")
+
+        ticks = iter([0.0] + [1.0] * 20 + [100.0] * 2)
+        delays = []
+
+        result = checker.wait_for_ready(
+            timeout=10, interval=2, clock=ticks.__next__, sleeper=delays.append
+        )
+
+        assert result is False
+        # Jitter is bounded at +-20%, so the first delay stays near 50 ms
+        assert delays[0] <= 0.05 * 1.2
+        # And no delay ever exceeds the interval cap (plus jitter)
+        assert max(delays) <= 2 * 1.2
+
 
 class TestHealthCheckerFullCheck:
     """Test full health check."""
 
-    def test_full_health_check_success(self):
+    def test_full_health_check_success(self, mock_conn, checker):
         """Test full health check with all checks passing."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_driver = Mock()
-        mock_conn.driver = mock_driver
-        mock_conn.execute_query.side_effect = [
-            [{"count": 1}],  # APOC check
-            [{"version": "2025.09.0"}],  # Version
-            [{"labels": ["Person"]}],  # Labels
-        ]
-        mock_conn.get_node_count.return_value = 10
-        mock_conn.get_relationship_count.return_value = 5
 
-        checker = HealthChecker(mock_conn)
+        # The post-connectivity checks run concurrently, so dispatch on the
+        # query text instead of relying on call order
+        def fake_execute_query(query, *args, **kwargs):
+            if "apoc.version" in query:
+                return [{"version": "2025.09.0"}]
+            if "dbms.components" in query:
+                return [{"version": "2025.09.0"}]
+            return [{"node_count": 10, "relationship_count": 5, "labels": ["Person"]}]
+
+        mock_conn.execute_query.side_effect = fake_execute_query
+
         health = checker.full_health_check()
 
         assert health["connected"] is True
@@ -170,14 +202,10 @@ class TestHealthCheckerFullCheck:
         assert health["version"] == "2025.09.0"
         assert health["stats"]["node_count"] == 10
 
-    def test_full_health_check_with_error(self):
+    def test_full_health_check_with_error(self, mock_conn, checker):
         """Test full health check when connection fails."""
-        mock_conn = Mock(spec=Neo4jConnection)
-        mock_driver = Mock()
-        mock_driver.verify_connectivity.side_effect = ServiceUnavailable("Failed")
-        mock_conn.driver = mock_driver
+        mock_conn.driver.session.side_effect = ServiceUnavailable("Failed")
 
-        checker = HealthChecker(mock_conn)
         health = checker.full_health_check()
 
         assert health["connected"] is False